@@ -17,10 +17,17 @@ import queue
 import threading
 import time
 import traceback
-from datetime import datetime
+import atexit
+import math
+import re
+import importlib.util
 from collections import deque
+from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
-from typing import Optional, Tuple, List, Any, Dict, Deque
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Optional, Tuple, List, Any, Dict, Callable
 
 # =============================================================================
 # == Optional Third-Party Library Imports & Placeholders ==
@@ -39,15 +46,8 @@ try:
 except ImportError:
     pyvisa = None  # Flag that pyvisa is missing
 
-try:
-    import pandas as pd
-except ImportError:
-    pd = None  # Flag that pandas is missing
-
-try:
-    import openpyxl
-except ImportError:
-    openpyxl = None # Flag that openpyxl is missing
+# openpyxl is only needed for XLSX export, so it is imported on first use rather than at startup
+_HAS_OPENPYXL = importlib.util.find_spec("openpyxl") is not None # Evaluated once; exporters run on worker threads
 
 try:
     import numpy as np
@@ -59,8 +59,7 @@ except ImportError:
 try:
     import matplotlib
     matplotlib.use('TkAgg')
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
+    import matplotlib.style as mplstyle # Style sheets without pulling in pyplot's figure manager
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
     from matplotlib.figure import Figure
 except ImportError:
@@ -89,10 +88,15 @@ except ImportError:
 DEFAULT_CONFIG_FILENAME = "power_logger_config.json"
 DEFAULT_PRESETS_FILENAME = "power_logger_presets.json"
 APP_ICON_FILENAME = "app_icon.ico" # Optional icon file
+APP_ICON_SIZE = 64 # Largest icon edge handed to Tk, in pixels
 
 # --- GUI Settings ---
 DEFAULT_GUI_THEME = "clam"
 DEFAULT_ENABLE_THEME_FADE = True
+SELECTION_DEBOUNCE_MS = 150 # Delay before applying a theme/style combobox choice
+QUEUE_POLL_MIN_MS = 50 # Status-queue poll interval while messages are arriving
+QUEUE_POLL_MAX_MS = 500 # Poll interval the loop backs off to while the queue stays empty
+CONFIG_SAVE_DEBOUNCE_MS = 500 # Delay before writing a changed config to disk
 UI_PADDING_X = 10
 UI_PADDING_Y = 10
 FRAME_PADDING_X = 10
@@ -118,16 +122,34 @@ LINE_WIDTH = 1.5
 LEGEND_LOCATION = 'upper right'
 LEGEND_FONTSIZE = 'small'
 MIN_PLOT_POINTS = 10
+DEFAULT_MAX_REDRAW_HZ = 2.0 # Live plot redraw cap, independent of the sampling interval
+MAX_POINTS_PER_FRAME = 256 # Queued samples folded into one plot update
+SIM_NOISE_BLOCK = 1024 # Simulated current-noise samples drawn per NumPy call
+STATUS_DEDUPE_WINDOW_S = 0.1 # Identical logger messages closer together than this are sent once
+LOG_INITIAL_ROWS = 4096 # Logged-sample buffer rows before the first doubling
+PENDING_POINTS_FACTOR = 10 # Unplotted samples held, in multiples of the plot window
+ANIMATION_ADAPT_PERIOD_S = 5.0 # How often the live plot re-tunes its frame interval
+ANIMATION_MAX_INTERVAL_MS = 500 # Slowest frame interval used while no samples are arriving
+AXIS_LIMIT_RTOL = 0.01 # Limit change, relative to the current span, below which set_xlim/set_ylim is skipped
 
 # --- Logging & Instrument ---
+CSV_WRITE_BUFFER_BYTES = 1 << 20 # File buffer for CSV exports
 VISA_OPEN_TIMEOUT_MS = 5000
 VISA_READ_WRITE_TIMEOUT_MS = 5000
+VISA_SHUTDOWN_TIMEOUT_MS = 250 # Bound on the final ":OUTP OFF" so a hung instrument cannot stall stop
 MIN_UPDATE_INTERVAL_MS = 10
 INITIAL_SETTLING_TIME_S = 1.0
 ZERO_VI_STOP_DELAY_S = 1.0
 ZERO_VI_THRESHOLD = 0.001
 MODE_CONSTANT_VOLTAGE = "Constant Voltage"
 MODE_CONSTANT_CURRENT = "Constant Current"
+# Per-mode threshold label, tooltips and implied stop condition (anything but CC is treated as CV)
+MODE_UI_TEXTS = {
+    MODE_CONSTANT_CURRENT: {'label': "Voltage Limit (V):", 'threshold': "CC: Stop when V > this limit.",
+                            'voltage': "CC: OVP Level.", 'current': "CC: Target Current.", 'stop': "above"},
+    MODE_CONSTANT_VOLTAGE: {'label': "Stop Threshold (A):", 'threshold': "CV: Stop when I < this limit.",
+                            'voltage': "CV: Target Voltage.", 'current': "CV: OCP Level.", 'stop': "below"},
+}
 
 # --- Status Codes (Values are lowercase strings for tags/logs) ---
 STATUS_INFO = "info"
@@ -135,6 +157,9 @@ STATUS_SUCCESS = "success"
 STATUS_WARNING = "warning"
 STATUS_ERROR = "error"
 STATUS_DEBUG = "debug" # For detailed internal logging
+STATUS_COLORS = {STATUS_INFO: "blue", STATUS_SUCCESS: "green", STATUS_WARNING: "dark orange",
+                 STATUS_ERROR: "red", STATUS_DEBUG: "gray"} # Status bar foreground per level
+DEBUG_MODE = os.environ.get("RIGOL_DEBUG") == "1" # Debug messages are dropped unless set
 
 # --- Export ---
 DEFAULT_EXPORT_FORMAT = "csv"
@@ -160,6 +185,7 @@ CONFIG_CATHODE = "cathode"
 CONFIG_ELECTROLYTE = "electrolyte"
 CONFIG_ELECTROLYTE_MOLARITY = "electrolyte_molarity"
 CONFIG_OPERATION_MODE = "operation_mode"
+CONFIG_MAX_REDRAW_HZ = "max_redraw_hz"
 
 
 # =============================================================================
@@ -171,11 +197,15 @@ class Tooltip:
     """
     Enhanced Tooltip class for Tkinter widgets.
     Handles widget destruction and geometry errors more gracefully.
+    All tooltips share one hidden Toplevel that is repositioned and withdrawn, never rebuilt per hover.
     """
+    _shared_tip: Optional[tk.Toplevel] = None
+    _shared_label: Optional[ttk.Label] = None
+    _shared_owner: Optional['Tooltip'] = None
+
     def __init__(self, widget, text=""):
         self.widget = widget
         self.text = text
-        self.tooltip_window = None
         self.widget.bind("<Enter>", self.show_tooltip)
         self.widget.bind("<Leave>", self.hide_tooltip)
         self.widget.bind("<Destroy>", self.hide_tooltip) # Hide on destroy
@@ -184,28 +214,39 @@ class Tooltip:
         """Updates the tooltip text."""
         self.text = text
 
+    @classmethod
+    def _get_shared_tip(cls, widget) -> Tuple[tk.Toplevel, ttk.Label]:
+        """Returns the shared tooltip window, creating it withdrawn on first use."""
+        if cls._shared_tip is None:
+            tip = tk.Toplevel(widget.winfo_toplevel())
+            tip.withdraw(); tip.wm_overrideredirect(True)
+            label = ttk.Label(tip, background="#FFFFEA", relief=tk.SOLID,
+                              borderwidth=1, wraplength=300)
+            label.pack(ipadx=1)
+            # Forget the window if Tk tears it down (e.g. with the root) so it is rebuilt on next use
+            tip.bind("<Destroy>", lambda e: cls._forget_shared_tip() if e.widget is tip else None)
+            cls._shared_tip, cls._shared_label = tip, label
+        return cls._shared_tip, cls._shared_label
+
+    @classmethod
+    def _forget_shared_tip(cls):
+        cls._shared_tip = cls._shared_label = cls._shared_owner = None
+
     def show_tooltip(self, event=None):
         """Displays the tooltip window, handling potential errors."""
-        if self.tooltip_window or not self.text:
+        if Tooltip._shared_owner is self or not self.text:
             return
 
         try:
-            # Check if widget still exists before proceeding
-            if not self.widget.winfo_exists():
-                return
-
             x, y, _, _ = self.widget.bbox("insert")
             x = x + self.widget.winfo_rootx() + 25
             y = y + self.widget.winfo_rooty() + 20
 
-            self.tooltip_window = tk.Toplevel(self.widget)
-            self.tooltip_window.wm_overrideredirect(True)
-            self.tooltip_window.wm_geometry(f"+{x}+{y}")
-
-            label = ttk.Label(self.tooltip_window, text=self.text,
-                              background="#FFFFEA", relief=tk.SOLID,
-                              borderwidth=1, wraplength=300)
-            label.pack(ipadx=1)
+            tip, label = Tooltip._get_shared_tip(self.widget)
+            label.configure(text=self.text)
+            tip.wm_geometry(f"+{x}+{y}")
+            tip.deiconify(); tip.lift()
+            Tooltip._shared_owner = self
 
         except tk.TclError:
             # Catch errors if widget disappears or bbox fails
@@ -215,18 +256,24 @@ class Tooltip:
             self.hide_tooltip()
 
     def hide_tooltip(self, event=None):
-        """Hides the tooltip window if it exists."""
-        if self.tooltip_window:
+        """Hides the shared tooltip window if this widget is showing it."""
+        if Tooltip._shared_owner is self:
+            Tooltip._shared_owner = None
             try:
-                if self.tooltip_window.winfo_exists():
-                    self.tooltip_window.destroy()
-            except tk.TclError:
+                Tooltip._shared_tip.withdraw()
+            except (tk.TclError, AttributeError):
                 pass # Ignore if already destroyed
-            finally:
-                self.tooltip_window = None
 
+_FLOAT_RE = re.compile(r'^[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?$')
+_INT_RE = re.compile(r'^[+-]?\d+$')
+
+# Results are cached per (input, name, bound): applying unchanged settings skips re-parsing.
+# Failures raise and are never cached, so a corrected entry is always re-checked.
+@lru_cache(maxsize=256, typed=True)
 def validate_float_input(value_str: str, name: str, allow_zero: bool = False) -> float:
     """Validates and converts a string to a non-negative float."""
+    if isinstance(value_str, str) and not _FLOAT_RE.match(value_str.strip()):
+        raise ValueError(f"Invalid {name}: '{value_str}'. Please enter a number.")
     try:
         value = float(value_str)
         if value < 0:
@@ -237,8 +284,11 @@ def validate_float_input(value_str: str, name: str, allow_zero: bool = False) ->
     except (ValueError, TypeError) as e:
         raise ValueError(f"Invalid {name}: '{value_str}'. Please enter a number. ({e})")
 
+@lru_cache(maxsize=256, typed=True)
 def validate_int_input(value_str: str, name: str, min_value: int) -> int:
     """Validates and converts a string to an integer above a minimum."""
+    if isinstance(value_str, str) and not _INT_RE.match(value_str.strip()):
+        raise ValueError(f"Invalid {name}: '{value_str}'. Please enter an integer.")
     try:
         value = int(value_str)
         if value < min_value:
@@ -253,45 +303,59 @@ def validate_int_input(value_str: str, name: str, min_value: int) -> int:
 # =============================================================================
 # (Could be moved to 'config.py')
 
+APP_BASE_PATH = os.path.dirname(os.path.abspath(sys.argv[0])) # Script directory; holds config/presets files
+
+DEFAULT_CONFIG: Dict[str, Any] = {
+    CONFIG_RESOURCE_NAME: "TCPIP0::192.168.1.100::INSTR", # Example TCP/IP
+    CONFIG_VOLTAGE: 4.0,
+    CONFIG_CURRENT: 0.5,
+    CONFIG_THRESHOLD: 0.062,
+    CONFIG_STOP_CONDITION: "below", # 'below' or 'above'
+    CONFIG_UPDATE_INTERVAL: 200,
+    CONFIG_MAX_PLOT_POINTS: 1000,
+    CONFIG_MAX_REDRAW_HZ: DEFAULT_MAX_REDRAW_HZ,
+    CONFIG_SAVE_LOCATION: APP_BASE_PATH,
+    CONFIG_EXPORT_FORMAT: DEFAULT_EXPORT_FORMAT,
+    CONFIG_GUI_THEME: DEFAULT_GUI_THEME,
+    CONFIG_PLOT_STYLE: DEFAULT_PLOT_STYLE,
+    CONFIG_SIMULATION_MODE: False,
+    CONFIG_NOTES: "",
+    CONFIG_ENABLE_THEME_FADE: DEFAULT_ENABLE_THEME_FADE,
+    CONFIG_ANODE: "",
+    CONFIG_CATHODE: "",
+    CONFIG_ELECTROLYTE: "",
+    CONFIG_ELECTROLYTE_MOLARITY: "",
+    CONFIG_OPERATION_MODE: MODE_CONSTANT_VOLTAGE
+}
+
 class ConfigManager:
     """Handles loading, saving, and managing app configuration and presets."""
 
     def __init__(self, config_file: str = DEFAULT_CONFIG_FILENAME,
                  presets_file: str = DEFAULT_PRESETS_FILENAME):
         """Initializes ConfigManager, defines defaults, and loads files."""
-        self.base_path = os.path.dirname(os.path.abspath(sys.argv[0]))
+        self.base_path = APP_BASE_PATH
         self.config_file = os.path.join(self.base_path, config_file)
         self.presets_file = os.path.join(self.base_path, presets_file)
 
         self.config: Dict[str, Any] = self._get_defaults()
         self.presets: Dict[str, Dict[str, Any]] = {}
+        self._preset_names_cache: Optional[List[str]] = None
+        self._preset_index_cache: Optional[Dict[str, int]] = None
+        # Background writes: file path -> (text, description); a newer write to the same file replaces a pending one
+        self._pending_writes: Dict[str, Tuple[str, str]] = {}
+        self._write_cond = threading.Condition()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stopping = False
+        # Called on the writer thread as (description, filepath, error) when a write fails
+        self.on_write_error: Optional[Callable[[str, str, Exception], None]] = None
 
         self.load_config()
         self.load_presets()
 
     def _get_defaults(self) -> Dict[str, Any]:
-        """Returns the default configuration dictionary."""
-        return {
-            CONFIG_RESOURCE_NAME: "TCPIP0::192.168.1.100::INSTR", # Example TCP/IP
-            CONFIG_VOLTAGE: 4.0,
-            CONFIG_CURRENT: 0.5,
-            CONFIG_THRESHOLD: 0.062,
-            CONFIG_STOP_CONDITION: "below", # 'below' or 'above'
-            CONFIG_UPDATE_INTERVAL: 200,
-            CONFIG_MAX_PLOT_POINTS: 1000,
-            CONFIG_SAVE_LOCATION: self.base_path,
-            CONFIG_EXPORT_FORMAT: DEFAULT_EXPORT_FORMAT,
-            CONFIG_GUI_THEME: DEFAULT_GUI_THEME,
-            CONFIG_PLOT_STYLE: DEFAULT_PLOT_STYLE,
-            CONFIG_SIMULATION_MODE: False,
-            CONFIG_NOTES: "",
-            CONFIG_ENABLE_THEME_FADE: DEFAULT_ENABLE_THEME_FADE,
-            CONFIG_ANODE: "",
-            CONFIG_CATHODE: "",
-            CONFIG_ELECTROLYTE: "",
-            CONFIG_ELECTROLYTE_MOLARITY: "",
-            CONFIG_OPERATION_MODE: MODE_CONSTANT_VOLTAGE
-        }
+        """Returns a fresh copy of the default configuration dictionary."""
+        return dict(DEFAULT_CONFIG) # Values are immutable, so a shallow copy is enough
 
     def _load_json_file(self, filepath: str, description: str) -> Dict:
         """Helper to load a JSON file with error handling."""
@@ -299,8 +363,8 @@ class ConfigManager:
             print(f"Info: {description} file not found: '{filepath}'. Using defaults/empty.")
             return {}
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(filepath, 'r', encoding='utf-8') as f: # Intern keys so lookups hit the CONFIG_* constants by identity
+                return json.load(f, object_pairs_hook=lambda pairs: {sys.intern(k): v for k, v in pairs})
         except json.JSONDecodeError as e:
             print(f"Warning: Error decoding {description} file {filepath}: {e}. Using defaults/empty.")
             return {}
@@ -311,18 +375,22 @@ class ConfigManager:
             print(f"Warning: Unexpected error loading {description} file {filepath}: {e}. Using defaults/empty.")
             return {}
 
-    def _save_json_file(self, filepath: str, data: Dict, description: str):
-        """Helper to save a JSON file with error handling."""
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
-        except IOError as e:
-            print(f"Error: Could not save {description} to {filepath}: {e}")
-            messagebox.showerror("Save Error", f"Could not save {description} to file:\n{filepath}\n\n{e}")
-        except Exception as e:
-            print(f"Error: Unexpected error saving {description}: {e}")
-            messagebox.showerror("Save Error", f"Unexpected error saving {description}:\n{e}")
-
+    @staticmethod
+    def _atomic_write(filepath: str, text: str) -> None:
+        """Writes `text` to a temp file and swaps it in, so readers never see a partial file."""
+        tmp_path = filepath + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f: f.write(text)
+        os.replace(tmp_path, filepath)
+
+    def _queue_write(self, filepath: str, data: Dict, description: str) -> None:
+        """Snapshots `data` as JSON and hands the disk write to the background writer thread."""
+        text = json.dumps(data, indent=4)
+        with self._write_cond:
+            self._pending_writes[filepath] = (text, description)
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(target=self._writer_loop, name="ConfigWriter", daemon=True)
+                self._writer_thread.start()
+            self._write_cond.notify()
 
     def load_config(self) -> None:
         """Loads config, merging with defaults to handle new keys."""
@@ -331,23 +399,46 @@ class ConfigManager:
         defaults.update(loaded_config) # Loaded values override defaults
         self.config = defaults
 
-    def save_config(self) -> None:
-        """Saves the current configuration."""
-        self._save_json_file(self.config_file, self.config, "Configuration")
+    def save_config_async(self) -> None:
+        """Snapshots the config and writes it on the background thread."""
+        self._queue_write(self.config_file, self.config, "Configuration")
+
+    def _writer_loop(self) -> None:
+        """Writes pending snapshots atomically; exits once stopping and nothing is left to write."""
+        while True:
+            with self._write_cond:
+                while not self._pending_writes and not self._writer_stopping: self._write_cond.wait()
+                if not self._pending_writes: return
+                jobs, self._pending_writes = self._pending_writes, {}
+            for filepath, (text, description) in jobs.items():
+                try:
+                    self._atomic_write(filepath, text)
+                except OSError as e:
+                    print(f"Error: Could not save {description} to {filepath}: {e}") # No messagebox off the UI thread
+                    if self.on_write_error: self.on_write_error(description, filepath, e)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Stops the writer after it has written everything still pending."""
+        if self._writer_thread is None: return
+        with self._write_cond:
+            self._writer_stopping = True; self._write_cond.notify()
+        self._writer_thread.join(timeout=timeout)
+        self._writer_thread = None; self._writer_stopping = False
 
     def load_presets(self) -> None:
         """Loads presets."""
         self.presets = self._load_json_file(self.presets_file, "Presets")
+        self._preset_names_cache = None
 
     def save_presets(self) -> None:
-        """Saves the current presets."""
-        self._save_json_file(self.presets_file, self.presets, "Presets")
+        """Snapshots the presets and writes them on the background thread."""
+        self._queue_write(self.presets_file, self.presets, "Presets")
 
-    def add_preset(self, name: str, preset_data: Dict[str, Any]) -> bool:
-        """Adds or updates a preset."""
+    def add_preset(self, name: str, preset_data: Dict[str, Any]) -> Optional[int]:
+        """Adds or updates a preset. Returns its index in the sorted names, or None."""
         if not name:
             messagebox.showwarning("Preset Error", "Preset name cannot be empty.")
-            return False
+            return None
         # Only save relevant keys
         keys_to_save = [
             CONFIG_RESOURCE_NAME, CONFIG_VOLTAGE, CONFIG_CURRENT,
@@ -355,9 +446,10 @@ class ConfigManager:
             CONFIG_ANODE, CONFIG_CATHODE, CONFIG_ELECTROLYTE,
             CONFIG_ELECTROLYTE_MOLARITY, CONFIG_OPERATION_MODE
         ]
+        if name not in self.presets: self._preset_names_cache = None
         self.presets[name] = {k: preset_data.get(k) for k in keys_to_save}
         self.save_presets()
-        return True
+        return self.get_preset_index(name)
 
     def get_preset(self, name: str) -> Optional[Dict[str, Any]]:
         """Retrieves a preset by name."""
@@ -367,13 +459,24 @@ class ConfigManager:
         """Deletes a preset."""
         if name in self.presets:
             del self.presets[name]
+            self._preset_names_cache = None
             self.save_presets()
             return True
         return False
 
     def get_preset_names(self) -> List[str]:
-        """Returns a sorted list of preset names."""
-        return sorted(self.presets.keys())
+        """Returns a sorted list of preset names (cached until presets change)."""
+        if self._preset_names_cache is None:
+            self._preset_names_cache = sorted(self.presets.keys())
+            self._preset_index_cache = None
+        return self._preset_names_cache
+
+    def get_preset_index(self, name: str) -> Optional[int]:
+        """Returns the position of a preset in get_preset_names(), or None."""
+        names = self.get_preset_names()
+        if self._preset_index_cache is None:
+            self._preset_index_cache = {n: i for i, n in enumerate(names)}
+        return self._preset_index_cache.get(name)
 
     def get_notes(self) -> str:
         """Gets notes from config."""
@@ -389,62 +492,153 @@ class ConfigManager:
 # =============================================================================
 # (Could be moved to 'data_handler.py')
 
+def with_derived_columns(samples) -> np.ndarray:
+    """Turns raw (t, V, I) samples into an (n, 5) float64 array of t, V, I, P, R."""
+    raw = np.asarray(samples, dtype=np.float64).reshape(-1, 3)
+    t, v, i = raw.T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = np.where(np.abs(i) > 1e-9, v / i, np.inf) # Open circuit reads as infinite resistance
+    return np.column_stack((t, v, i, v * i, r))
+
 class DataManager:
-    """Manages data queues and deques for logging and plotting."""
+    """Manages the data queue and the NumPy buffers behind the plot's sliding window."""
     def __init__(self, max_plot_points: int = 1000):
         self.max_plot_points = max(max_plot_points, MIN_PLOT_POINTS)
-        self.data_queue: queue.Queue[List[float]] = queue.Queue()
-        self.time_data: Deque[float] = deque(maxlen=self.max_plot_points)
-        self.voltage_data: Deque[float] = deque(maxlen=self.max_plot_points)
-        self.current_data: Deque[float] = deque(maxlen=self.max_plot_points)
-        self.power_data: Deque[float] = deque(maxlen=self.max_plot_points)
-        self.resistance_data: Deque[float] = deque(maxlen=self.max_plot_points)
-
-    def put(self, data_point: List[float]): self.data_queue.put(data_point)
-    def get_nowait(self) -> List[float]: return self.data_queue.get_nowait()
-    def empty(self) -> bool: return self.data_queue.empty()
-
-    def append_for_plotting(self, t: float, v: float, i: float, p: float, r: float):
-        """Appends data to deques for the plot's sliding window."""
-        self.time_data.append(t); self.voltage_data.append(v)
-        self.current_data.append(i); self.power_data.append(p)
-        self.resistance_data.append(r)
+        # Samples from the logging thread, handed over in bulk: one lock per put, one per drain.
+        # Bounded so a stalled UI drops the oldest unplotted samples instead of growing without limit
+        # (the full log is kept separately by the logger for export).
+        self._pending: deque = deque(maxlen=PENDING_POINTS_FACTOR * self.max_plot_points)
+        self._pending_lock = threading.Lock()
+        # Rows are t, V, I, P, R. Twice the window is allocated so appends only compact
+        # (one block copy) every max_plot_points samples and each row view stays contiguous.
+        self._buf = np.empty((5, 2 * self.max_plot_points), dtype=np.float64)
+        self._start = 0; self._end = 0
+        # Running finite min/max of V, I, P, R over the window; a channel is rescanned only
+        # after an eviction removed one of its current extremes.
+        self._lo = np.full(4, np.inf); self._hi = np.full(4, -np.inf)
+        self._limits_stale = np.zeros(4, dtype=bool)
+
+    def put(self, data_point: Tuple[float, float, float]):
+        with self._pending_lock: self._pending.append(data_point)
+
+    def drain(self, limit: Optional[int] = None) -> List[Tuple[float, float, float]]:
+        """Takes up to `limit` (default: all) pending samples, oldest first, under a single lock."""
+        with self._pending_lock:
+            if limit is None or limit >= len(self._pending):
+                items = list(self._pending); self._pending.clear()
+            else:
+                popleft = self._pending.popleft
+                items = [popleft() for _ in range(limit)]
+        return items
+
+    def __len__(self) -> int: return self._end - self._start
+
+    def extend_for_plotting(self, rows) -> None:
+        """Appends a block of raw (t, V, I) samples; P and R are derived for the whole block at once."""
+        block = with_derived_columns(np.asarray(rows, dtype=np.float64).reshape(-1, 3)[-self.max_plot_points:])
+        n = len(block)
+        if not n: return
+        new_start = max(self._start, self._end + n - self.max_plot_points) # Drop what falls out of the window
+        if new_start > self._start:
+            evicted = self._buf[1:, self._start:new_start]
+            self._limits_stale |= ((evicted == self._lo[:, None]) | (evicted == self._hi[:, None])).any(axis=1)
+            self._start = new_start
+        if self._end + n > self._buf.shape[1]: self._compact()
+        self._buf[:, self._end:self._end + n] = block.T
+        self._end += n
+        vals = block[:, 1:]
+        finite = np.isfinite(vals)
+        np.minimum(self._lo, np.where(finite, vals, np.inf).min(axis=0), out=self._lo)
+        np.maximum(self._hi, np.where(finite, vals, -np.inf).max(axis=0), out=self._hi)
+
+    def channel_limits(self, channel: int) -> Optional[Tuple[float, float]]:
+        """Returns (min, max) of the finite values of channel 0-3 (V, I, P, R), or None if there are none."""
+        if self._limits_stale[channel]:
+            data = self._buf[channel + 1, self._start:self._end]
+            data = data[np.isfinite(data)]
+            self._lo[channel], self._hi[channel] = (data.min(), data.max()) if data.size else (np.inf, -np.inf)
+            self._limits_stale[channel] = False
+        lo, hi = self._lo[channel], self._hi[channel]
+        return (float(lo), float(hi)) if lo <= hi else None
+
+    def drain_for_plotting(self, limit: int = MAX_POINTS_PER_FRAME) -> int:
+        """Moves up to `limit` queued samples into the plot window. Returns how many were moved."""
+        rows = self.drain(limit)
+        if rows: self.extend_for_plotting(rows)
+        return len(rows)
+
+    def _compact(self):
+        """Moves the live window back to the start of the buffer."""
+        n = self._end - self._start
+        self._buf[:, :n] = self._buf[:, self._start:self._end]
+        self._start, self._end = 0, n
+
+    def view(self) -> np.ndarray:
+        """Returns a (5, n) zero-copy view of the window: t, V, I, P, R."""
+        return self._buf[:, self._start:self._end]
+
+    @property
+    def time_data(self) -> np.ndarray: return self._buf[0, self._start:self._end]
+    @property
+    def voltage_data(self) -> np.ndarray: return self._buf[1, self._start:self._end]
+    @property
+    def current_data(self) -> np.ndarray: return self._buf[2, self._start:self._end]
+    @property
+    def power_data(self) -> np.ndarray: return self._buf[3, self._start:self._end]
+    @property
+    def resistance_data(self) -> np.ndarray: return self._buf[4, self._start:self._end]
 
     def clear_plot_data(self):
-        """Clears only the plotting deques."""
-        self.time_data.clear(); self.voltage_data.clear()
-        self.current_data.clear(); self.power_data.clear()
-        self.resistance_data.clear()
+        """Clears only the plotting window."""
+        self._start = self._end = 0
+        self._lo.fill(np.inf); self._hi.fill(-np.inf); self._limits_stale.fill(False)
+
+    def resize(self, max_plot_points: int) -> None:
+        """Changes the window size in place, keeping the most recent samples. No-op if unchanged."""
+        new_max = max(max_plot_points, MIN_PLOT_POINTS)
+        if new_max == self.max_plot_points: return
+        keep = self.view()[:, -new_max:]
+        n = keep.shape[1]
+        buf = np.empty((5, 2 * new_max), dtype=np.float64)
+        buf[:, :n] = keep
+        self._buf, self._start, self._end = buf, 0, n
+        self.max_plot_points = new_max
+        self._limits_stale.fill(True) # Rescan lazily; the dropped samples may have held the extremes
+        with self._pending_lock:
+            self._pending = deque(self._pending, maxlen=PENDING_POINTS_FACTOR * new_max)
 
 class DataExporter:
     """Handles exporting logged data to various file formats."""
 
     HEADERS = ["Time (s)", "Voltage (V)", "Current (A)", "Power (W)", "Resistance (Ω)"]
+    # Settings recorded alongside the data; CSV also records the instrument resource
+    SETTINGS_KEYS = (CONFIG_VOLTAGE, CONFIG_CURRENT, CONFIG_OPERATION_MODE,
+                     CONFIG_THRESHOLD, CONFIG_STOP_CONDITION, CONFIG_ANODE,
+                     CONFIG_CATHODE, CONFIG_ELECTROLYTE, CONFIG_ELECTROLYTE_MOLARITY)
+    CSV_SETTINGS_KEYS = (CONFIG_RESOURCE_NAME, CONFIG_OPERATION_MODE, CONFIG_VOLTAGE,
+                         CONFIG_CURRENT, CONFIG_THRESHOLD, CONFIG_STOP_CONDITION,
+                         CONFIG_ANODE, CONFIG_CATHODE, CONFIG_ELECTROLYTE,
+                         CONFIG_ELECTROLYTE_MOLARITY)
 
     @staticmethod
-    def _add_metadata_to_csv(writer: csv.writer, config: Dict, notes: str):
-        """Writes configuration and notes as comments to a CSV file."""
-        writer.writerow(['# --- Configuration ---'])
-        cfg_keys = [CONFIG_RESOURCE_NAME, CONFIG_OPERATION_MODE, CONFIG_VOLTAGE,
-                    CONFIG_CURRENT, CONFIG_THRESHOLD, CONFIG_STOP_CONDITION,
-                    CONFIG_ANODE, CONFIG_CATHODE, CONFIG_ELECTROLYTE,
-                    CONFIG_ELECTROLYTE_MOLARITY]
-        for k in cfg_keys:
-            writer.writerow([f'# {k.upper()}: {config.get(k, "N/A")}'])
-        writer.writerow(['# --- Notes ---'])
-        for line in notes.splitlines():
-            writer.writerow([f'# {line}'])
-        writer.writerow(['# --- Data ---'])
+    def _add_metadata_to_csv(f, config: Dict, notes: str):
+        """Writes configuration and notes as comment lines to a CSV file in one write."""
+        lines = (['# --- Configuration ---']
+                 + [f'# {k.upper()}: {config.get(k, "N/A")}' for k in DataExporter.CSV_SETTINGS_KEYS]
+                 + ['# --- Notes ---'] + [f'# {ln}' for ln in notes.splitlines()]
+                 + ['# --- Data ---', ''])
+        f.write("\r\n".join(lines))
 
     @staticmethod
     def save_to_csv(filepath: str, data: List, config: Dict, notes: str) -> Tuple[bool, str]:
         """Saves data to a CSV file."""
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                DataExporter._add_metadata_to_csv(writer, config, notes)
-                writer.writerow(DataExporter.HEADERS)
-                writer.writerows(data)
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER_BYTES) as f:
+                DataExporter._add_metadata_to_csv(f, config, notes)
+                csv.writer(f).writerow(DataExporter.HEADERS)
+                # Data rows in one NumPy pass; %.15g keeps full reading precision, \r\n matches csv.writer
+                arr = np.asarray(data, dtype=np.float64).reshape(-1, len(DataExporter.HEADERS))
+                np.savetxt(f, arr, fmt="%.15g", delimiter=",", newline="\r\n")
             return True, f"CSV saved: {os.path.basename(filepath)}"
         except IOError as e:
             return False, f"CSV I/O Error: {e}"
@@ -453,57 +647,66 @@ class DataExporter:
 
     @staticmethod
     def save_to_excel(filepath: str, data: List, config: Dict, notes: str) -> Tuple[bool, str]:
-        """Saves data and metadata to an Excel file."""
-        if not pd or not openpyxl:
-            return False, "Excel export requires 'pandas' and 'openpyxl'."
+        """Saves data and metadata to an Excel file, streamed through a write-only workbook."""
+        if not _HAS_OPENPYXL:
+            return False, "Excel export requires 'openpyxl'."
         try:
-            df_data = pd.DataFrame(data, columns=DataExporter.HEADERS)
-            cfg_data = {k: config.get(k, "N/A") for k in [
-                CONFIG_VOLTAGE, CONFIG_CURRENT, CONFIG_OPERATION_MODE,
-                CONFIG_THRESHOLD, CONFIG_STOP_CONDITION, CONFIG_ANODE,
-                CONFIG_CATHODE, CONFIG_ELECTROLYTE, CONFIG_ELECTROLYTE_MOLARITY]}
-            config_df = pd.DataFrame.from_dict(cfg_data, orient='index', columns=['Value'])
-            notes_df = pd.DataFrame(notes.splitlines(), columns=["Notes"])
-
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-                df_data.to_excel(writer, sheet_name='Data', index=False)
-                config_df.to_excel(writer, sheet_name='Settings', index=True)
-                notes_df.to_excel(writer, sheet_name='Notes', index=False)
+            import openpyxl
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font
+            wb = openpyxl.Workbook(write_only=True)
+            bold = Font(bold=True)
+            def header(ws, *values):
+                row = []
+                for v in values:
+                    cell = WriteOnlyCell(ws, value=v); cell.font = bold; row.append(cell)
+                return row
+
+            ws = wb.create_sheet('Data')
+            ws.append(header(ws, *DataExporter.HEADERS))
+            arr = np.asarray(data, dtype=np.float64).reshape(-1, len(DataExporter.HEADERS))
+            if np.isfinite(arr).all():
+                for row in arr.tolist(): ws.append(row)
+            else: # Excel has no inf/NaN; write them as text (inf) or blank (NaN)
+                for row in arr.tolist():
+                    ws.append([x if math.isfinite(x) else (None if math.isnan(x) else str(x)) for x in row])
+
+            ws = wb.create_sheet('Settings')
+            ws.append(header(ws, None, 'Value'))
+            for k in DataExporter.SETTINGS_KEYS:
+                ws.append([*header(ws, k), config.get(k, "N/A")])
+
+            ws = wb.create_sheet('Notes')
+            ws.append(header(ws, "Notes"))
+            for line in notes.splitlines(): ws.append([line])
+
+            wb.save(filepath)
             return True, f"Excel saved: {os.path.basename(filepath)}"
-        except (ImportError, NameError):
-             return False, "Excel export requires 'pandas' and 'openpyxl'."
         except Exception as e:
             return False, f"Excel Save Error: {e}"
 
     @staticmethod
     def save_to_json(filepath: str, data: List, config: Dict, notes: str) -> Tuple[bool, str]:
-        """Saves data and metadata to a JSON file."""
-        if not pd:
-             return False, "JSON export requires 'pandas'."
+        """Saves data and metadata to a JSON file (columnar rows, no per-row keys)."""
         try:
-            df_data = pd.DataFrame(data, columns=DataExporter.HEADERS)
-            cfg_data = {k: config.get(k, "N/A") for k in [
-                CONFIG_VOLTAGE, CONFIG_CURRENT, CONFIG_OPERATION_MODE,
-                CONFIG_THRESHOLD, CONFIG_STOP_CONDITION, CONFIG_ANODE,
-                CONFIG_CATHODE, CONFIG_ELECTROLYTE, CONFIG_ELECTROLYTE_MOLARITY]}
+            cfg_data = {k: config.get(k, "N/A") for k in DataExporter.SETTINGS_KEYS}
             json_output = {
                 "settings": cfg_data,
                 "notes": notes,
-                "data": df_data.to_dict(orient="records")
+                "schema": DataExporter.HEADERS,
+                "data": np.asarray(data, dtype=float).tolist()
             }
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(json_output, f, indent=4)
+                json.dump(json_output, f, separators=(',', ':'))
             return True, f"JSON saved: {os.path.basename(filepath)}"
-        except (ImportError, NameError):
-             return False, "JSON export requires 'pandas'."
         except Exception as e:
             return False, f"JSON Save Error: {e}"
 
     @staticmethod
     def export_data(base_filename: str, data: List, config: Dict, notes: str,
-                      status_queue: queue.Queue):
+                      status_queue: queue.SimpleQueue):
         """Exports data to formats specified in config."""
-        if not data:
+        if len(data) == 0:
             status_queue.put((STATUS_WARNING, "No data logged to export."))
             return
 
@@ -515,6 +718,7 @@ class DataExporter:
         }
 
         formats_to_save = save_map.keys() if export_format == "all" else [export_format]
+        data = with_derived_columns(data) # t, V, I -> t, V, I, P, R once for every format
 
         for fmt in formats_to_save:
             if fmt in save_map:
@@ -533,22 +737,36 @@ class DataLogger:
     """Handles instrument communication, simulation, and data logging."""
 
     def __init__(self, config: Dict, data_manager: DataManager,
-                 status_queue: queue.Queue):
+                 status_queue: queue.SimpleQueue):
         """Initializes the logger."""
         self.config = config
         self.data_manager = data_manager
         self.status_queue = status_queue
         self.dp: Optional[pyvisa.Resource] = None
-        self.rm: Optional[pyvisa.ResourceManager] = None
+        self.rm: Optional[pyvisa.ResourceManager] = None # Shared with the app's scans; never closed here
         self.stop_event = threading.Event()
         self.logging_thread: Optional[threading.Thread] = None
         self.is_simulating = self.config.get(CONFIG_SIMULATION_MODE, False)
-        self._logged_data: List[List[float]] = []
+        # Raw (t, V, I) samples; rows [0, _n_logged) are valid, capacity doubles when full
+        self._logged_data = np.empty((LOG_INITIAL_ROWS, 3), dtype=np.float64)
+        self._n_logged = 0
         self._sim_start_time: Optional[float] = None
-
-    def _send_status(self, level: str, message: str):
-        """Helper to send status messages."""
-        self.status_queue.put((level, message))
+        self._sim_v_set, self._sim_c_set = 4.0, 0.5 # Setpoints, re-read from config on start()
+        self._sim_noise: List[float] = []; self._sim_noise_idx = SIM_NOISE_BLOCK
+        self._use_meas_all = True # Cleared if the instrument rejects ":MEAS:ALL?"
+        self._meas_all_verified = False # Set after the first good ":MEAS:ALL?"; later failures are real I/O errors
+        self._save_dir: Optional[str] = None # Export directory, resolved and created by start()
+        self._last_status: Optional[tuple] = None; self._last_status_time = 0.0
+
+    def _send_status(self, level: str, message: str, *args):
+        """Helper to send status messages. `args` are %-formatted into `message` on the UI thread."""
+        if level == STATUS_DEBUG and not DEBUG_MODE: return
+        item = (level, message, args) if args else (level, message)
+        now = time.monotonic()
+        if item == self._last_status and now - self._last_status_time < STATUS_DEDUPE_WINDOW_S:
+            return # Same message again within the window (e.g. an error burst); the UI already shows it
+        self._last_status, self._last_status_time = item, now
+        self.status_queue.put(item)
 
     def connect(self) -> bool:
         """Connects to the VISA instrument or sets up simulation."""
@@ -567,7 +785,7 @@ class DataLogger:
 
         try:
             self._send_status(STATUS_INFO, f"Connecting to: {resource_name}")
-            self.rm = pyvisa.ResourceManager()
+            if self.rm is None: self.rm = pyvisa.ResourceManager() # Per-library singleton, shared with scans
             self.dp = self.rm.open_resource(resource_name, open_timeout=VISA_OPEN_TIMEOUT_MS)
             self.dp.timeout = VISA_READ_WRITE_TIMEOUT_MS
             self.dp.read_termination = '\n'
@@ -589,18 +807,17 @@ class DataLogger:
         """Safely closes the instrument connection."""
         if self.dp:
             try:
-                # Try turning off output, but don't fail if already closed
-                try: self.dp.write(":OUTP OFF")
+                # Try turning off output, but don't fail if already closed or hang on an unresponsive instrument
+                try: self.dp.timeout = VISA_SHUTDOWN_TIMEOUT_MS; self.dp.write(":OUTP OFF")
                 except Exception: pass
                 self.dp.close()
                 self._send_status(STATUS_INFO, "Instrument connection closed.")
             except Exception as e:
                 self._send_status(STATUS_ERROR, f"Error closing instrument: {e}")
             finally: self.dp = None
-        if self.rm:
-            try: self.rm.close()
-            except Exception: pass
-            finally: self.rm = None
+        # The ResourceManager is not closed: pyvisa shares one session per VISA library, so closing it
+        # would also close the app's scan manager (and any other open resource). The app closes it at exit.
+        self.rm = None
 
     def _setup_instrument(self) -> bool:
         """Sets up the instrument based on current config."""
@@ -637,6 +854,12 @@ class DataLogger:
             self._send_status(STATUS_WARNING, "Logging already running.")
             return False
 
+        try:
+            self._save_dir = self._resolve_save_dir() # Now, so stop() does no directory work
+        except OSError as e:
+            self._send_status(STATUS_ERROR, f"Cannot create save location: {e}")
+            return False
+
         if not self.is_simulating:
             if not self.dp:
                 self._send_status(STATUS_ERROR, "Not connected.")
@@ -646,9 +869,12 @@ class DataLogger:
                 return False
         else:
             self._sim_start_time = time.time()
+            self._sim_v_set = self.config.get(CONFIG_VOLTAGE, 4.0)
+            self._sim_c_set = self.config.get(CONFIG_CURRENT, 0.5)
+            self._sim_noise_idx = SIM_NOISE_BLOCK # Forces a fresh noise block on the first read
             self._send_status(STATUS_INFO, "Simulation started.")
 
-        self._logged_data = [] # Clear previous data
+        self._n_logged = 0 # Clear previous data; the buffer is reused
         self.logging_thread = threading.Thread(target=self._log_data_loop, daemon=True)
         self.logging_thread.start()
         return True
@@ -663,7 +889,7 @@ class DataLogger:
             self.logging_thread.join(timeout=5.0) # Wait a bit longer
 
         base_filename = self._generate_base_filename()
-        DataExporter.export_data(base_filename, self._logged_data,
+        DataExporter.export_data(base_filename, self._logged_data[:self._n_logged],
                                  self.config, notes_content, self.status_queue)
 
         if not self.is_simulating:
@@ -672,99 +898,104 @@ class DataLogger:
             self._send_status(STATUS_INFO, "Simulation stopped.")
 
         self.logging_thread = None
-        self._send_status(STATUS_SUCCESS, f"Logger stopped. {len(self._logged_data)} points recorded.")
+        self._send_status(STATUS_SUCCESS, f"Logger stopped. {self._n_logged} points recorded.")
+
+    def _resolve_save_dir(self) -> str:
+        """Resolves and creates the export directory; empty config falls back to a 'logs' folder next to the script."""
+        loc = self.config.get(CONFIG_SAVE_LOCATION, "").strip() # Get and strip whitespace
+        if not loc:
+            loc = os.path.join(APP_BASE_PATH, "logs")
+            self._send_status(STATUS_WARNING, f"Save location was empty. Defaulting to: {loc}")
+        os.makedirs(loc, exist_ok=True)
+        return loc
 
     def _generate_base_filename(self) -> str:
-        """Generates a base filename for exports."""
+        """Generates a base filename for exports (no filesystem access; the directory was made at start)."""
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         v = str(self.config.get(CONFIG_VOLTAGE, 0.0)).replace('.', '_')
         c = str(self.config.get(CONFIG_CURRENT, 0.0)).replace('.', '_')
-        loc = self.config.get(CONFIG_SAVE_LOCATION, "").strip() # Get and strip whitespace
-
-        # --- START ADDED VALIDATION ---
-        if not loc: # If location is empty after stripping
-            # Default to the directory of the script or the current working directory
-            # Using self.config_manager.base_path if DataLogger has access or a known default
-            # For simplicity, let's assume we can use a 'logs' subdirectory in the app's base path
-            # This requires DataLogger to know the base_path.
-            # A robust way would be for PowerLoggerApp to pass its config_manager.base_path
-            # or to set a sensible default during ConfigManager initialization.
-            # For an immediate fix within DataLogger if it doesn't have base_path:
-            try:
-                # Attempt to use the script's directory
-                script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-                loc = os.path.join(script_dir, "logs") # Default to a 'logs' subdirectory
-                self._send_status(STATUS_WARNING, f"Save location was empty. Defaulting to: {loc}")
-            except Exception:
-                # Fallback to current working directory if sys.argv[0] is problematic (e.g. in frozen app)
-                loc = os.path.join(os.getcwd(), "logs")
-                self._send_status(STATUS_WARNING, f"Save location was empty. Defaulting to: {loc}")
-        os.makedirs(loc, exist_ok=True)
+        loc = self._save_dir or os.path.join(APP_BASE_PATH, "logs")
         return os.path.join(loc, f"Rigol Power Supply V{v}_A{c}_{ts}")
 
     def _read_instrument(self) -> Tuple[float, float]:
-        """Reads voltage and current from the instrument."""
+        """Reads voltage and current from the instrument, in one round-trip where supported."""
+        if self._use_meas_all:
+            try:
+                # DP800 series: ":MEAS:ALL?" answers "V,I,P" in a single transaction
+                v, c, *_ = self.dp.query_ascii_values(":MEAS:ALL? CH1", separator=',', container=list)
+                self._meas_all_verified = True
+                return v, c
+            except ValueError as e: # Reply didn't parse as "V,I,..."
+                self._use_meas_all = False # Fall back to separate queries for the rest of this run
+                self._send_status(STATUS_WARNING, "Combined measure query failed (%s); using separate V/I queries.", e)
+            except pyvisa.errors.VisaIOError as e:
+                # Instruments that don't know the command just stay silent; anything else is a real I/O failure
+                if self._meas_all_verified or e.error_code != pyvisa.constants.StatusCode.error_timeout \
+                        or not self._last_command_rejected():
+                    raise
+                self._use_meas_all = False
+                self._send_status(STATUS_WARNING, "Instrument does not support \":MEAS:ALL?\"; using separate V/I queries.")
         v = float(self.dp.query(":MEAS:VOLT? CH1"))
         c = float(self.dp.query(":MEAS:CURR? CH1"))
         return v, c
 
+    def _last_command_rejected(self) -> bool:
+        """True if the instrument's error queue holds a SCPI command error (-100 to -199)."""
+        try: code = int(self.dp.query(":SYST:ERR?").split(',', 1)[0])
+        except Exception: return False
+        return -199 <= code <= -100
+
     def _read_simulation(self, elapsed_time: float) -> Tuple[float, float]:
         """Generates simulated voltage and current."""
-        v = self.config.get(CONFIG_VOLTAGE, 4.0)
-        c_set = self.config.get(CONFIG_CURRENT, 0.5)
+        if self._sim_noise_idx == SIM_NOISE_BLOCK: # Draw noise in blocks rather than one randn() per sample
+            self._sim_noise = (np.random.randn(SIM_NOISE_BLOCK) * 0.005).tolist(); self._sim_noise_idx = 0
+        noise = self._sim_noise[self._sim_noise_idx]; self._sim_noise_idx += 1
         # Simulate current decay (or change based on mode later if needed)
-        c = max(0, c_set - 0.05 * elapsed_time + np.random.randn() * 0.005)
-        return v, c
-
-    def _check_stop_condition(self, v: float, i: float) -> bool:
-        """Checks if the auto-stop conditions are met."""
-        mode = self.config.get(CONFIG_OPERATION_MODE)
-        threshold = self.config.get(CONFIG_THRESHOLD)
-        condition = self.config.get(CONFIG_STOP_CONDITION) # 'below' or 'above'
-
-        value_to_check = abs(i) if mode == MODE_CONSTANT_VOLTAGE else v
-        limit_type = "Current" if mode == MODE_CONSTANT_VOLTAGE else "Voltage"
-        unit = "A" if mode == MODE_CONSTANT_VOLTAGE else "V"
+        c = max(0.0, self._sim_c_set - 0.05 * elapsed_time + noise)
+        return self._sim_v_set, c
 
-        stop = False
-        if condition.lower() == "below" and value_to_check < threshold:
-            self._send_status(STATUS_WARNING, f"Stop: {limit_type} {value_to_check:.4f} < {threshold:.4f} {unit}.")
-            stop = True
-        elif condition.lower() == "above" and value_to_check > threshold:
-            self._send_status(STATUS_WARNING, f"Stop: {limit_type} {value_to_check:.4f} > {threshold:.4f} {unit}.")
-            stop = True
-
-        return stop
+    def _stop_rule(self) -> Tuple[bool, str, float, str, str]:
+        """Resolves the auto-stop settings once: (check_current, condition, threshold, limit_type, unit)."""
+        check_current = self.config.get(CONFIG_OPERATION_MODE) == MODE_CONSTANT_VOLTAGE
+        condition = str(self.config.get(CONFIG_STOP_CONDITION) or "").lower() # 'below' or 'above'
+        threshold = float(self.config.get(CONFIG_THRESHOLD) or 0.0)
+        return (check_current, condition, threshold,
+                "Current" if check_current else "Voltage", "A" if check_current else "V")
 
     def _log_data_loop(self):
         """The main data logging loop running in a thread."""
         try:
             interval_ms = self.config.get(CONFIG_UPDATE_INTERVAL, 200)
             delay_s = max(interval_ms, MIN_UPDATE_INTERVAL_MS) / 1000.0
-            start_time = time.time()
+            check_current, condition, threshold, limit_type, unit = self._stop_rule()
+            # Hoisted out of the per-sample path
+            read = self._read_simulation if self.is_simulating else (lambda et: self._read_instrument())
+            put_dm = self.data_manager.put; stop_is_set = self.stop_event.is_set
+            perf = time.perf_counter # One monotonic clock for both sample times and pacing
+            start_time = perf()
+            next_deadline = start_time + delay_s # Absolute schedule, so pacing error doesn't accumulate
             points = 0
             self._send_status(STATUS_INFO, f"Logging started (Interval: {delay_s*1000:.0f}ms).")
 
-            while not self.stop_event.is_set():
-                loop_start = time.perf_counter()
-                now = time.time(); et = now - start_time
+            while not stop_is_set():
+                et = perf() - start_time
                 v_m, c_m = 0.0, 0.0
 
                 try:
-                    v_m, c_m = self._read_simulation(et) if self.is_simulating else self._read_instrument()
+                    v_m, c_m = read(et)
                 except pyvisa.errors.VisaIOError as e:
                     self._send_status(STATUS_ERROR, f"VISA Read Error: {e}. Stopping.")
                     self.stop_event.set(); break
                 except Exception as e:
-                    self._send_status(STATUS_ERROR, f"Read Error: {e}. Stopping.")
-                    print(traceback.format_exc())
+                    # Traceback goes to the log pane (the status bar shows the first line); no stderr I/O here
+                    self._send_status(STATUS_ERROR, f"Read Error: {e}. Stopping.\n{traceback.format_exc()}")
                     self.stop_event.set(); break
 
-                p = v_m * c_m
-                r = v_m / c_m if abs(c_m) > 1e-9 else float('inf')
-                row = [et, v_m, c_m, p, r]
-                self._logged_data.append(row)
-                self.data_manager.put(row)
+                row = (et, v_m, c_m) # P and R are derived in bulk for plotting and export
+                if self._n_logged == len(self._logged_data):
+                    self._logged_data = np.concatenate((self._logged_data, np.empty_like(self._logged_data)))
+                self._logged_data[self._n_logged] = row; self._n_logged += 1
+                put_dm(row)
                 points += 1
 
                 # --- Stop Condition Checks ---
@@ -775,7 +1006,13 @@ class DataLogger:
                     stop_now = True
                 # 2. Threshold Check (after settling time)
                 elif et > INITIAL_SETTLING_TIME_S:
-                    stop_now = self._check_stop_condition(v_m, c_m)
+                    value_to_check = abs(c_m) if check_current else v_m
+                    if condition == "below" and value_to_check < threshold:
+                        self._send_status(STATUS_WARNING, f"Stop: {limit_type} {value_to_check:.4f} < {threshold:.4f} {unit}.")
+                        stop_now = True
+                    elif condition == "above" and value_to_check > threshold:
+                        self._send_status(STATUS_WARNING, f"Stop: {limit_type} {value_to_check:.4f} > {threshold:.4f} {unit}.")
+                        stop_now = True
 
                 if stop_now:
                     if not self.is_simulating and self.dp:
@@ -788,13 +1025,14 @@ class DataLogger:
                     self._send_status("STOP_SIGNAL", "Auto-Stop Triggered") # Special signal
                     break # Exit loop immediately
 
-                # --- Sleep ---
-                sleep_dur = delay_s - (time.perf_counter() - loop_start)
-                if sleep_dur > 0: time.sleep(sleep_dur)
+                # --- Sleep until the next slot; waiting on the event lets stop() interrupt it ---
+                t = perf(); wait_s = next_deadline - t
+                if wait_s > 0: self.stop_event.wait(wait_s)
+                else: next_deadline = t # Fell behind (slow read); restart the grid rather than burst
+                next_deadline += delay_s
 
         except Exception as e:
-            self._send_status(STATUS_ERROR, f"Critical Log Loop Error: {e}")
-            print(traceback.format_exc())
+            self._send_status(STATUS_ERROR, f"Critical Log Loop Error: {e}\n{traceback.format_exc()}")
         finally:
             self._send_status("LOGGER_FINISHED", "Logger thread has ended.")
 
@@ -811,13 +1049,44 @@ class PowerLoggerApp:
         """Initializes the GUI, config, logger, and other components."""
         self.root = root
         self.config_manager = ConfigManager()
+        self.config_manager.on_write_error = self._on_config_write_error
         self.data_manager = DataManager(self.config_manager.config.get(CONFIG_MAX_PLOT_POINTS))
-        self.status_queue = queue.Queue()
+        self.status_queue = queue.SimpleQueue() # (level, message[, args]) from every thread; no task tracking needed
         self.logger: Optional[DataLogger] = None
         self.is_logging = False
         self.executor = ThreadPoolExecutor(max_workers=3) # Allow threads for scan, log, etc.
+        self._shutdown_event = threading.Event() # Set on exit; workers then skip posting back to Tk
         self._after_check_queues_id: Optional[str] = None
-        self.ani: Optional[animation.FuncAnimation] = None
+        self._poll_interval_ms = QUEUE_POLL_MIN_MS # Adapted by check_queues to the message rate
+        self._theme_apply_after_id: Optional[str] = None
+        self._style_apply_after_id: Optional[str] = None
+        self._config_save_after_id: Optional[str] = None
+        self._config_dirty = False
+        self._plot_running = False # Live plot loop active (lines are animated and blitted)
+        self._plot_after_id: Optional[str] = None # Pending live-plot frame
+        self._plot_background = None # Blit background (line-free figure) while the live plot runs
+        self._rm: Optional["pyvisa.ResourceManager"] = None # Created lazily by `rm`
+        self._available_themes: frozenset = (frozenset(self.root.get_themes())
+                                             if hasattr(self.root, 'get_themes') else frozenset())
+        atexit.register(self._close_resource_manager)
+        self._palette_cache: Dict[Optional[str], Dict[str, str]] = {} # ttk theme name -> plot palette
+        self._active_theme: Optional[str] = None
+        self._drain_scheduled = False # An after_idle status drain is pending
+        # Logger signals that trigger an action when drained from the status queue, by level
+        self._signal_handlers = {"STOP_SIGNAL": self.stop_logging, "LOGGER_FINISHED": self._stop_if_logging}
+        self._log_buffer: List[Tuple[str, str]] = [] # (log line, level) awaiting _flush_log_buffer
+        self._last_status: Optional[Tuple[str, str]] = None # Latest (message, level) for the status bar
+        self._ts_second = -1; self._ts_prefix = "" # Cached "[H:M:S] " log prefix and the second it was formatted for
+        self._status_bar_level: Optional[str] = None # Level whose color the status bar currently shows
+        self._state_widget_paths: Optional[List[Tuple[str, str]]] = None # Filled on first update_ui_state
+        self._applied_states: Dict[str, str] = {} # State kind -> Tk state last applied by update_ui_state
+        self._plot_style_sig: Optional[Tuple[Any, str]] = None # (canvas, bg) last applied by _restyle_plot_for_theme
+        self._settings_built = False # Settings tab widgets are created lazily by _on_tab_changed
+        self._plot_visible = False # Plot tab selected; while hidden, frames only advance the data window
+        self.preset_listbox: Optional[tk.Listbox] = None
+        self._listbox_names: List[str] = [] # Names currently shown in preset_listbox, in order
+        self._root_alive = True # Cleared by <Destroy>; cheaper than winfo_exists and safe off the UI thread
+        self.root.bind('<Destroy>', self._on_root_destroy, add='+')
 
         # --- Check Critical Dependencies ---
         if not pyvisa:
@@ -829,9 +1098,15 @@ class PowerLoggerApp:
         # --- Tkinter Variables ---
         self._setup_variables()
 
+        # --- Button Callbacks (bound once, shared by the widgets) ---
+        self._cb_scan = self.scan_visa_resources
+        self._cb_browse = self.browse_save_location
+        self._cb_start = self.start_logging
+        self._cb_stop = self.stop_logging
+        self._cb_save_notes = self.save_notes
+
         # --- Build UI ---
         try:
-            self._setup_variables()
             self.root.title("Power Supply Stopper")
             self.root.geometry("950x750"); self.root.minsize(800, 600)
             self._set_icon()
@@ -843,6 +1118,7 @@ class PowerLoggerApp:
             self._create_plot_canvas()
             self._create_plot_lines()
             self._create_plot_toolbar()
+            self._restyle_plot_for_theme()
             self.check_queues() # Start queue polling
             self.scan_visa_resources(auto_scan=True) # Auto-scan on launch
             self.update_ui_state(self.is_logging)
@@ -861,6 +1137,7 @@ class PowerLoggerApp:
         self.status_var = StringVar(value="Ready")
         self.update_interval_var = StringVar()
         self.max_plot_points_var = StringVar()
+        self.max_redraw_rate_var = StringVar()
         self.gui_theme_var = StringVar()
         self.plot_style_var = StringVar()
         self.simulation_mode_var = BooleanVar()
@@ -875,24 +1152,10 @@ class PowerLoggerApp:
     def _load_initial_values(self):
         """Loads configuration values into Tkinter variables."""
         cfg = self.config_manager.config
-        self.resource_var.set(cfg.get(CONFIG_RESOURCE_NAME, ""))
-        self.voltage_var.set(str(cfg.get(CONFIG_VOLTAGE)))
-        self.current_var.set(str(cfg.get(CONFIG_CURRENT)))
-        self.threshold_var.set(str(cfg.get(CONFIG_THRESHOLD)))
-        self.stop_condition_var.set(cfg.get(CONFIG_STOP_CONDITION))
-        self.save_location_var.set(cfg.get(CONFIG_SAVE_LOCATION))
-        self.export_format_var.set(cfg.get(CONFIG_EXPORT_FORMAT))
-        self.update_interval_var.set(str(cfg.get(CONFIG_UPDATE_INTERVAL)))
-        self.max_plot_points_var.set(str(cfg.get(CONFIG_MAX_PLOT_POINTS)))
-        self.gui_theme_var.set(cfg.get(CONFIG_GUI_THEME))
-        self.plot_style_var.set(cfg.get(CONFIG_PLOT_STYLE))
-        self.simulation_mode_var.set(cfg.get(CONFIG_SIMULATION_MODE))
+        # Same field tables that apply_and_save_config reads back from
+        for key, attr, *_ in self._NUMERIC_FIELDS: getattr(self, attr).set(str(cfg.get(key)))
+        for key, attr, _ in self._PLAIN_FIELDS: getattr(self, attr).set(cfg.get(key, ""))
         self.enable_theme_fade_var.set(cfg.get(CONFIG_ENABLE_THEME_FADE))
-        self.anode_var.set(cfg.get(CONFIG_ANODE, ""))
-        self.cathode_var.set(cfg.get(CONFIG_CATHODE, ""))
-        self.electrolyte_var.set(cfg.get(CONFIG_ELECTROLYTE, ""))
-        self.electrolyte_molarity_var.set(cfg.get(CONFIG_ELECTROLYTE_MOLARITY, ""))
-        self.operation_mode_var.set(cfg.get(CONFIG_OPERATION_MODE))
         self.load_notes()
 
     def _handle_initialization_error(self, error):
@@ -909,12 +1172,12 @@ class PowerLoggerApp:
         if not (Image and ImageTk): return
         try:
             icon_path = os.path.join(self.config_manager.base_path, APP_ICON_FILENAME)
-            if os.path.exists(icon_path):
-                pil_image = Image.open(icon_path)
-                tk_image = ImageTk.PhotoImage(pil_image)
-                self.root.iconphoto(True, tk_image)
-            else:
-                print(f"Info: Icon file '{APP_ICON_FILENAME}' not found.")
+            with Image.open(icon_path) as pil_image:
+                pil_image.thumbnail((APP_ICON_SIZE, APP_ICON_SIZE)) # .ico files often carry a 256px frame; Tk only needs a small one
+                self._icon_image = ImageTk.PhotoImage(pil_image) # Keep a reference for the window's lifetime
+            self.root.iconphoto(True, self._icon_image)
+        except FileNotFoundError:
+            print(f"Info: Icon file '{APP_ICON_FILENAME}' not found.")
         except Exception as e:
             print(f"Warning: Could not set window icon: {e}.")
 
@@ -933,13 +1196,24 @@ class PowerLoggerApp:
 
         self.main_tab, self.plot_tab, self.settings_tab, self.log_tab, self.notes_tab = tabs.values()
 
-        # 🛠 Set up all tabs before load_presets_listbox() or update_ui_state()
+        # 🛠 Set up these tabs before update_ui_state(); Settings is built the first time it is shown
         self._setup_control_tab()
         self._setup_plot_tab()
-        self._setup_notes_tab()    # MOVE THIS BEFORE settings_tab
+        self._setup_notes_tab()
         self._setup_log_tab()
-        self._setup_settings_tab()  # This will call load_presets_listbox()
-
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add='+')
+
+    def _on_tab_changed(self, event=None):
+        """Tracks plot visibility and builds the Settings tab on first visit."""
+        selected = self.notebook.select()
+        was_visible, self._plot_visible = self._plot_visible, selected == str(self.plot_tab)
+        if self._plot_visible and not was_visible: self._refresh_plot()
+        # The Settings widgets only read the Tk variables, so they can be created late
+        if self._settings_built or selected != str(self.settings_tab): return
+        self._settings_built = True
+        self._setup_settings_tab() # This will call load_presets_listbox()
+        self._state_widget_paths = None; self._applied_states.clear() # Pick up the new widgets
+        self.update_ui_state()
 
     def _create_label_entry(self, parent, label_text, row, var, tooltip_text="", style=FRAME_STYLE, col=1, **kwargs):
         """Helper to create a Label and Entry pair."""
@@ -966,7 +1240,7 @@ class PowerLoggerApp:
         f = ttk.Frame(cf, **FRAME_STYLE); f.grid(row=r, column=1, columnspan=2, sticky=GRID_STICKY_EW, padx=5, pady=3)
         self.resource_combobox = ttk.Combobox(f, textvariable=self.resource_var, state="readonly")
         self.resource_combobox.pack(fill=tk.X, expand=True)
-        self.scan_button = ttk.Button(cf, text="Scan", command=self.scan_visa_resources, width=6)
+        self.scan_button = ttk.Button(cf, text="Scan", command=self._cb_scan, width=6)
         self.scan_button.grid(row=r, column=3, padx=5, pady=3); r += 1
 
         ttk.Label(cf, text="Operation Mode:").grid(row=r, column=0, sticky=GRID_STICKY_W, padx=5, pady=3);
@@ -985,7 +1259,7 @@ class PowerLoggerApp:
         self.threshold_tooltip = Tooltip(self.threshold_entry); r += 1
 
         self.save_location_entry = self._create_label_entry(cf, "Save Location:", r, self.save_location_var, "Directory for log files", columnspan=2)
-        self.browse_button = ttk.Button(cf, text="Browse...", command=self.browse_save_location, width=10)
+        self.browse_button = ttk.Button(cf, text="Browse...", command=self._cb_browse, width=10)
         self.browse_button.grid(row=r, column=3, padx=5, pady=3); r += 1
 
         ttk.Label(cf, text="Export Format:").grid(row=r, column=0, sticky=GRID_STICKY_W, padx=5, pady=3)
@@ -1005,9 +1279,9 @@ class PowerLoggerApp:
         # --- Status & Buttons ---
         self.status_indicator = ttk.Label(sf, textvariable=self.status_var, anchor=tk.W, wraplength=STATUS_WRAPLENGTH)
         self.status_indicator.pack(fill=tk.X, padx=5, pady=3)
-        self.start_button = ttk.Button(bf, text="Start Logging", command=self.start_logging)
+        self.start_button = ttk.Button(bf, text="Start Logging", command=self._cb_start)
         self.start_button.pack(side=tk.LEFT, padx=5)
-        self.stop_button = ttk.Button(bf, text="Stop Logging", command=self.stop_logging, state=tk.DISABLED)
+        self.stop_button = ttk.Button(bf, text="Stop Logging", command=self._cb_stop, state=tk.DISABLED)
         self.stop_button.pack(side=tk.LEFT, padx=5)
         self._update_threshold_label() # Set initial tooltips
 
@@ -1018,6 +1292,7 @@ class PowerLoggerApp:
         r = 0
         self.update_interval_entry = self._create_label_entry(gsf, "Update Interval (ms):", r, self.update_interval_var, f"Min {MIN_UPDATE_INTERVAL_MS}ms."); r += 1
         self.max_plot_points_entry = self._create_label_entry(gsf, "Max Plot Points:", r, self.max_plot_points_var, f"Min {MIN_PLOT_POINTS}."); r += 1
+        self.max_redraw_rate_entry = self._create_label_entry(gsf, "Max Plot Redraw (Hz):", r, self.max_redraw_rate_var, "Live plot refresh cap; samples are still logged at the update interval."); r += 1
 
         ttk.Label(gsf, text="Simulation Mode:").grid(row=r, column=0, **g)
         self.simulation_mode_check = ttk.Checkbutton(gsf, variable=self.simulation_mode_var, command=self.update_ui_state) # Update UI on change
@@ -1034,11 +1309,10 @@ class PowerLoggerApp:
         af = ttk.LabelFrame(self.settings_tab, text="Appearance"); af.pack(fill=tk.X, padx=FRAME_PADDING_X, pady=(FRAME_PADDING_Y_TOP, FRAME_PADDING_Y_BOTTOM))
         r = 0
         ttk.Label(af, text="GUI Theme:").grid(row=r, column=0, **g); f = ttk.Frame(af, **FRAME_STYLE); f.grid(row=r, column=1, **ge)
-        themes = sorted(self.root.get_themes()) if hasattr(self.root, 'get_themes') else ["default"]
-        self.gui_theme_combobox = ttk.Combobox(f, textvariable=self.gui_theme_var, state="readonly", values=themes)
+        self.gui_theme_combobox = ttk.Combobox(f, textvariable=self.gui_theme_var, state="readonly", postcommand=self._populate_theme_values)
         self.gui_theme_combobox.pack(fill=tk.X, expand=True); self.gui_theme_combobox.bind("<<ComboboxSelected>>", self.on_gui_theme_selected); r += 1
         ttk.Label(af, text="Plot Style:").grid(row=r, column=0, **g); f = ttk.Frame(af, **FRAME_STYLE); f.grid(row=r, column=1, **ge)
-        self.plot_style_combobox = ttk.Combobox(f, textvariable=self.plot_style_var, state="readonly", values=sorted(plt.style.available))
+        self.plot_style_combobox = ttk.Combobox(f, textvariable=self.plot_style_var, state="readonly", values=sorted(mplstyle.available))
         self.plot_style_combobox.pack(fill=tk.X, expand=True); self.plot_style_combobox.bind("<<ComboboxSelected>>", self.on_plot_style_selected); r += 1
         af.columnconfigure(1, weight=1)
 
@@ -1054,15 +1328,18 @@ class PowerLoggerApp:
         s = ttk.Scrollbar(f, command=self.preset_listbox.yview); s.pack(side=tk.RIGHT, fill=tk.Y); self.preset_listbox.config(yscrollcommand=s.set); self.preset_listbox.bind("<Double-Button-1>", lambda e: self.load_preset()); r += 1
         self.load_presets_listbox(); pf.columnconfigure(1, weight=1); pf.rowconfigure(r-1, weight=1)
 
+    def _populate_theme_values(self):
+        """Fills the theme list the first time the combobox is opened."""
+        self.gui_theme_combobox['values'] = sorted(self._available_themes) or ["default"]
+        self.gui_theme_combobox.config(postcommand="") # One-shot
+
     def _setup_log_tab(self):
         """Builds the Log Tab UI."""
         f = ttk.Frame(self.log_tab); f.pack(fill=tk.BOTH, expand=True, padx=UI_PADDING_X, pady=(UI_PADDING_Y, FRAME_PADDING_Y_BOTTOM))
         self.log_text = tk.Text(f, state=tk.DISABLED, wrap=tk.WORD, height=10); self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         s = ttk.Scrollbar(f, command=self.log_text.yview); s.pack(side=tk.RIGHT, fill=tk.Y); self.log_text.config(yscrollcommand=s.set)
-        # Define tag colors
-        self.log_text.tag_config(STATUS_INFO, foreground="blue"); self.log_text.tag_config(STATUS_SUCCESS, foreground="green")
-        self.log_text.tag_config(STATUS_WARNING, foreground="dark orange"); self.log_text.tag_config(STATUS_ERROR, foreground="red")
-        self.log_text.tag_config(STATUS_DEBUG, foreground="gray")
+        # Define tag colors once, from the same table as the status bar
+        for level, color in STATUS_COLORS.items(): self.log_text.tag_config(level, foreground=color)
         f_btn = ttk.Frame(self.log_tab); f_btn.pack(fill=tk.X, pady=FRAME_PADDING_Y_BOTTOM, padx=UI_PADDING_X)
         ttk.Button(f_btn, text="Clear Log", command=self.clear_log).pack(side=tk.LEFT)
 
@@ -1072,7 +1349,7 @@ class PowerLoggerApp:
         self.notes_text = tk.Text(f, wrap=tk.WORD, height=10); self.notes_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         s = ttk.Scrollbar(f, command=self.notes_text.yview); s.pack(side=tk.RIGHT, fill=tk.Y); self.notes_text.config(yscrollcommand=s.set)
         f_btn = ttk.Frame(self.notes_tab); f_btn.pack(fill=tk.X, pady=FRAME_PADDING_Y_BOTTOM, padx=UI_PADDING_X)
-        ttk.Button(f_btn, text="Save Notes", command=self.save_notes).pack(side=tk.LEFT, padx=5)
+        ttk.Button(f_btn, text="Save Notes", command=self._cb_save_notes).pack(side=tk.LEFT, padx=5)
 
     def save_notes(self):
         """Saves notes from the text widget to config (but not file)."""
@@ -1083,40 +1360,20 @@ class PowerLoggerApp:
     def load_notes(self):
         """Loads notes from config into the text widget."""
         if self.notes_text:
-            self.notes_text.config(state=tk.NORMAL)
-            self.notes_text.delete("1.0", tk.END)
-            self.notes_text.insert("1.0", self.config_manager.get_notes())
+            self._set_widget_state_outside_cache(self.notes_text, 'normal', tk.NORMAL)
+            self.notes_text.replace("1.0", tk.END, self.config_manager.get_notes()) # Single Tcl call
 
     
     def _update_threshold_label(self):
         """Updates threshold label and tooltips based on operation mode."""
-        if not self.root.winfo_exists():
+        if not self._root_alive:
             return
-        mode = self.operation_mode_var.get()
-        if mode == MODE_CONSTANT_CURRENT:
-            self.threshold_label_widget.config(text="Voltage Limit (V):")
-            self.threshold_tooltip.set_text("CC: Stop when V > this limit.")
-            self.voltage_tooltip.set_text("CC: OVP Level.")
-            self.current_tooltip.set_text("CC: Target Current.")
-            self.stop_condition_var.set("above")
-        else:  # CV
-            self.threshold_label_widget.config(text="Stop Threshold (A):")
-            self.threshold_tooltip.set_text("CV: Stop when I < this limit.")
-            self.voltage_tooltip.set_text("CV: Target Voltage.")
-            self.current_tooltip.set_text("CV: OCP Level.")
-            self.stop_condition_var.set("below")
-        if not self.root.winfo_exists(): return
-        mode = self.operation_mode_var.get()
-        if mode == MODE_CONSTANT_CURRENT:
-            self.threshold_label_widget.config(text="Voltage Limit (V):")
-            self.threshold_tooltip.set_text("CC: Stop when V > this limit.")
-            self.voltage_tooltip.set_text("CC: OVP Level.")
-            self.current_tooltip.set_text("CC: Target Current.")
-        else: # CV
-            self.threshold_label_widget.config(text="Stop Threshold (A):")
-            self.threshold_tooltip.set_text("CV: Stop when I < this limit.")
-            self.voltage_tooltip.set_text("CV: Target Voltage.")
-            self.current_tooltip.set_text("CV: OCP Level.")
+        t = MODE_UI_TEXTS.get(self.operation_mode_var.get(), MODE_UI_TEXTS[MODE_CONSTANT_VOLTAGE])
+        self.threshold_label_widget.config(text=t['label'])
+        self.threshold_tooltip.set_text(t['threshold'])
+        self.voltage_tooltip.set_text(t['voltage'])
+        self.current_tooltip.set_text(t['current'])
+        self.stop_condition_var.set(t['stop'])
 
     def scan_visa_resources(self, auto_scan=False):
         """Scans for VISA resources in a separate thread."""
@@ -1125,26 +1382,46 @@ class PowerLoggerApp:
             if self.resource_combobox: self.resource_combobox['values'] = ["PyVISA Missing"]
             return
         if not auto_scan: self.add_status_message("Scanning VISA resources...", STATUS_INFO)
-        if self.scan_button: self.scan_button.config(state=tk.DISABLED)
-        if self.resource_combobox: self.resource_combobox.config(state=tk.DISABLED)
+        if self.scan_button: self._set_widget_state_outside_cache(self.scan_button, 'visa', tk.DISABLED)
+        if self.resource_combobox: self._set_widget_state_outside_cache(self.resource_combobox, 'visa_readonly', tk.DISABLED)
         self.executor.submit(self._scan_visa_task, auto_scan)
 
+    @property
+    def rm(self) -> "pyvisa.ResourceManager":
+        """Shared ResourceManager for scans and logging, created on first use (and again if its session was closed)."""
+        if self._rm is not None:
+            try: self._rm.session
+            except pyvisa.errors.InvalidSession: self._rm = None
+        if self._rm is None:
+            self._rm = pyvisa.ResourceManager()
+        return self._rm
+
+    def _on_root_destroy(self, event):
+        """Records that the root window is gone (child <Destroy> events are ignored)."""
+        if event.widget is self.root: self._root_alive = False
+
+    def _close_resource_manager(self):
+        """Closes the cached ResourceManager, if one was created."""
+        if self._rm is not None:
+            try: self._rm.close()
+            except Exception: pass
+            finally: self._rm = None
+
     def _scan_visa_task(self, auto_scan):
         """Task to list VISA resources."""
         resources, error_msg = [], None
+        if self._shutdown_event.is_set(): return
         try:
-            rm = pyvisa.ResourceManager()
-            resources = rm.list_resources()
-            rm.close()
+            resources = self.rm.list_resources()
         except Exception as e:
             error_msg = f"VISA Scan Error: {e}"
             print(traceback.format_exc())
-        if self.root.winfo_exists():
+        if self._root_alive and not self._shutdown_event.is_set():
             self.root.after(0, self._update_visa_list, resources, error_msg, auto_scan)
 
     def _update_visa_list(self, resources, error_msg, auto_scan):
         """Updates the VISA combobox in the GUI thread."""
-        if not self.root.winfo_exists() or not self.resource_combobox: return
+        if not self._root_alive or not self.resource_combobox: return
 
         current_value = self.resource_var.get()
 
@@ -1152,18 +1429,18 @@ class PowerLoggerApp:
             self.add_status_message(error_msg, STATUS_ERROR)
             self.resource_combobox['values'] = ["Scan Error"]
         elif resources:
-            self.resource_combobox['values'] = list(resources)
+            resources = tuple(resources)
+            if resources != tuple(self.resource_combobox['values']): # Rescans usually find the same list
+                self.resource_combobox['values'] = resources
             if not auto_scan or not current_value:
                  self.add_status_message(f"Found {len(resources)} VISA resource(s).", STATUS_INFO)
-            # Try to re-select or select first if empty/not present
-            if current_value in resources: self.resource_var.set(current_value)
-            elif resources: self.resource_var.set(resources[0])
+            # Keep the current selection if it is still present, otherwise select the first resource
+            if current_value not in set(resources): self.resource_var.set(resources[0])
         else:
             self.resource_combobox['values'] = ["No Resources Found"]
             if not auto_scan: self.add_status_message("No VISA resources found.", STATUS_WARNING)
 
-        if self.scan_button: self.scan_button.config(state=tk.NORMAL)
-        self.update_ui_state() # Re-apply state based on sim mode etc.
+        self.update_ui_state() # Re-enables the scan controls unless logging/sim mode keeps them disabled
 
     # --- Plotting Methods ---
     def _setup_plot_tab(self):
@@ -1174,20 +1451,34 @@ class PowerLoggerApp:
         if self.fig and self.plot_tab:
             # Destroy existing canvas widget if it exists
             # self.canvas is the FigureCanvasTkAgg instance
-            if hasattr(self, 'canvas') and self.canvas and \
-               hasattr(self.canvas, 'get_tk_widget') and \
-               self.canvas.get_tk_widget().winfo_exists():
-                self.canvas.get_tk_widget().destroy()
+            if getattr(self, 'canvas', None):
+                try: self.canvas.get_tk_widget().destroy()
+                except tk.TclError: pass # Already gone
 
             self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_tab)
             self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+            self.canvas.get_tk_widget().bind("<Destroy>", self._on_canvas_destroy, add='+')
+            self.canvas.mpl_connect('draw_event', self._on_plot_draw)
+
+    def _on_canvas_destroy(self, event=None):
+        """Stops the live-plot loop once its canvas is gone, so no frame ticks against a dead widget."""
+        self._cancel_plot_loop()
+
+    def _cancel_plot_loop(self):
+        """Cancels the pending live-plot frame and drops the cached background."""
+        self._plot_running = False
+        if self._plot_after_id:
+            try: self.root.after_cancel(self._plot_after_id)
+            except tk.TclError: pass
+            self._plot_after_id = None
+        self._plot_background = None
 
     def _create_plot_toolbar(self):
         if self.canvas and self.plot_tab: # self.canvas must exist here
             # Destroy existing toolbar widget instance if it exists
-            if hasattr(self, 'toolbar_instance') and self.toolbar_instance and \
-               self.toolbar_instance.winfo_exists():
-                self.toolbar_instance.destroy() # Destroy the old toolbar frame
+            if getattr(self, 'toolbar_instance', None):
+                try: self.toolbar_instance.destroy() # Destroy the old toolbar frame
+                except tk.TclError: pass # Already gone
 
             # Create and store the new toolbar instance
             self.toolbar_instance = NavigationToolbar2Tk(self.canvas, self.plot_tab)
@@ -1203,7 +1494,10 @@ class PowerLoggerApp:
                 filetypes=[("PNG", "*.png"), ("JPEG", "*.jpg"), ("PDF", "*.pdf")]
             )
             if filepath:
-                self.fig.savefig(filepath)
+                self._set_lines_animated(False) # Animated artists are skipped by savefig
+                try: self.fig.savefig(filepath)
+                finally:
+                    if self._plot_running: self._set_lines_animated(True); self.canvas.draw() # Re-cache the background
                 self.add_status_message(f"Plot saved: {os.path.basename(filepath)}", STATUS_SUCCESS)
         except Exception as e:
             self.add_status_message(f"Error saving plot: {e}", STATUS_ERROR)
@@ -1211,14 +1505,20 @@ class PowerLoggerApp:
 
     def _create_plot_figure(self):
         """Creates the Matplotlib figure and axes."""
-        if hasattr(self, 'fig') and self.fig: plt.close(self.fig)
         style = self.config_manager.config.get(CONFIG_PLOT_STYLE, DEFAULT_PLOT_STYLE)
         try:
-            plt.style.use(style)
+            mplstyle.use(style)
         except Exception as e:
             self.add_status_message(f"Warning: Plot style '{style}' error: {e}. Using default.", STATUS_WARNING)
-            plt.style.use(DEFAULT_PLOT_STYLE)
-        self.fig, axes = plt.subplots(4, 1, sharex=True, figsize=PLOT_FIGURE_SIZE)
+            mplstyle.use(DEFAULT_PLOT_STYLE)
+        if getattr(self, 'fig', None): # Style change: rebuild the axes in place so canvas and toolbar survive
+            self.fig.clear()
+            self.fig.set_facecolor(matplotlib.rcParams['figure.facecolor'])
+            self.fig.set_edgecolor(matplotlib.rcParams['figure.edgecolor'])
+        else: # A bare Figure: not registered with pyplot, so no hidden manager window or global figure state
+            self.fig = Figure(figsize=PLOT_FIGURE_SIZE)
+        axes = self.fig.subplots(4, 1, sharex=True)
+        self._axis_limits: Dict[Tuple[int, str], Tuple[float, float]] = {} # Last limits set per (axes id, 'x'/'y')
         self.ax_v, self.ax_i, self.ax_p, self.ax_r = axes
         self.ax_v.set_ylabel("Voltage (V)"); self.ax_i.set_ylabel("Current (A)")
         self.ax_p.set_ylabel("Power (W)"); self.ax_r.set_ylabel("Resistance (Ω)")
@@ -1228,76 +1528,151 @@ class PowerLoggerApp:
 
     def _create_plot_lines(self):
         """Creates the Matplotlib line objects for plotting."""
-        self.line_v, = self.ax_v.plot([], [], VOLTAGE_LINE_STYLE, label="V", lw=LINE_WIDTH)
-        self.line_i, = self.ax_i.plot([], [], CURRENT_LINE_STYLE, label="I", lw=LINE_WIDTH)
-        self.line_p, = self.ax_p.plot([], [], POWER_LINE_STYLE, label="P", lw=LINE_WIDTH)
-        self.line_r, = self.ax_r.plot([], [], RESISTANCE_LINE_STYLE, label="R", lw=LINE_WIDTH)
+        self._empty = np.empty(0, dtype=np.float64) # Shared buffer for empty lines
+        e = self._empty
+        self.line_v, = self.ax_v.plot(e, e, VOLTAGE_LINE_STYLE, label="V", lw=LINE_WIDTH)
+        self.line_i, = self.ax_i.plot(e, e, CURRENT_LINE_STYLE, label="I", lw=LINE_WIDTH)
+        self.line_p, = self.ax_p.plot(e, e, POWER_LINE_STYLE, label="P", lw=LINE_WIDTH)
+        self.line_r, = self.ax_r.plot(e, e, RESISTANCE_LINE_STYLE, label="R", lw=LINE_WIDTH)
         for ax in [self.ax_v, self.ax_i, self.ax_p, self.ax_r]:
             ax.legend(loc=LEGEND_LOCATION, fontsize=LEGEND_FONTSIZE)
 
+    def _clear_plot_lines(self):
+        """Empties all plot lines without reallocating their data arrays."""
+        e = self._empty
+        for line in (self.line_v, self.line_i, self.line_p, self.line_r):
+            line.set_data(e, e)
+
     def _apply_plot_style(self, style_name: str):
         """Applies a new plot style and redraws."""
         self.config_manager.config[CONFIG_PLOT_STYLE] = style_name
         self._create_plot_figure(); self._create_plot_lines()
-        self._create_plot_canvas(); self._create_plot_toolbar()
+        if not getattr(self, 'canvas', None):
+            self._create_plot_canvas(); self._create_plot_toolbar()
+        elif getattr(self, 'toolbar_instance', None):
+            self.toolbar_instance.update() # Old axes are gone; forget their zoom/pan history
+        self._restyle_plot_for_theme()
         if self.canvas: self.canvas.draw_idle()
-        if self.is_logging and self.ani:
-            self.ani.event_source.stop(); self.start_animation()
+        if self.is_logging: self.start_animation()
 
     def _apply_theme(self, theme_name: str):
         """Applies a new GUI theme."""
         if hasattr(self.root, 'set_theme'):
-             self.root.set_theme(theme_name)
-             self.add_status_message(f"Theme set to '{theme_name}'.", STATUS_INFO)
-             self._redraw_plot_for_theme()
+             if theme_name not in self._available_themes:
+                 self.add_status_message("Theme '%s' not available. Using '%s'.", STATUS_WARNING, theme_name, DEFAULT_GUI_THEME)
+                 theme_name = DEFAULT_GUI_THEME
+             try: self.root.set_theme(theme_name)
+             except tk.TclError as e:
+                 self.add_status_message("Failed to apply theme '%s': %s. Using 'clam'.", STATUS_WARNING, theme_name, e)
+                 theme_name = "clam"
+                 try: self.root.set_theme(theme_name)
+                 except tk.TclError: return
+             self._active_theme = theme_name
+             self.add_status_message("Theme set to '%s'.", STATUS_INFO, theme_name)
+             try: self._redraw_plot_for_theme() # A restyle failure must not trigger a second theme change
+             except Exception as e:
+                 self.add_status_message("Plot restyle after theme change failed: %s", STATUS_WARNING, e)
+                 print(traceback.format_exc())
 
     def _redraw_plot_for_theme(self):
-        """Redraws plot when theme changes to match colors."""
-        self._apply_plot_style(self.config_manager.config.get(CONFIG_PLOT_STYLE))
+        """Updates the plot when the theme changes (the figure itself is kept)."""
+        self._restyle_plot_for_theme()
+
+    def _theme_palette(self) -> Dict[str, str]:
+        """Returns the colors of the active ttk theme used around the plot (memoized per theme)."""
+        palette = self._palette_cache.get(self._active_theme)
+        if palette is None:
+            bg = ttk.Style(self.root).lookup('TFrame', 'background') or 'white'
+            palette = self._palette_cache[self._active_theme] = {'bg': bg}
+        return palette
+
+    def _restyle_plot_for_theme(self):
+        """Matches the plot's Tk canvas to the theme without rebuilding the figure."""
+        if not getattr(self, 'canvas', None): return # Plot not built yet
+        bg = self._theme_palette()['bg']
+        sig = (self.canvas, bg)
+        if sig == self._plot_style_sig: return # Same canvas, same colors
+        try: self.canvas.get_tk_widget().configure(background=bg, highlightbackground=bg)
+        except tk.TclError: return
+        self._plot_style_sig = sig
 
     def on_gui_theme_selected(self, event=None):
+        """Applies the chosen theme once the selection settles."""
+        if self._theme_apply_after_id: self.root.after_cancel(self._theme_apply_after_id)
+        self._theme_apply_after_id = self.root.after(SELECTION_DEBOUNCE_MS, self._apply_selected_theme)
+
+    def _apply_selected_theme(self):
+        self._theme_apply_after_id = None
         self._apply_theme(self.gui_theme_var.get())
         self.apply_and_save_config() # Save theme change
 
     def on_plot_style_selected(self, event=None):
+        """Applies the chosen plot style once the selection settles."""
+        if self._style_apply_after_id: self.root.after_cancel(self._style_apply_after_id)
+        self._style_apply_after_id = self.root.after(SELECTION_DEBOUNCE_MS, self._apply_selected_plot_style)
+
+    def _apply_selected_plot_style(self):
+        self._style_apply_after_id = None
         self._apply_plot_style(self.plot_style_var.get())
         self.apply_and_save_config() # Save style change
 
+    # (attribute name, state kind) for every widget toggled by update_ui_state.
+    # List attributes (radio groups) are toggled as a whole.
+    _STATE_BOUND_WIDGETS = (
+        ('voltage_entry', 'normal'), ('current_entry', 'normal'),
+        ('threshold_entry', 'normal'), ('save_location_entry', 'normal'),
+        ('browse_button', 'normal'), ('update_interval_entry', 'normal'),
+        ('max_plot_points_entry', 'normal'), ('max_redraw_rate_entry', 'normal'),
+        ('preset_name_entry', 'normal'),
+        ('save_preset_button', 'normal'), ('delete_preset_button', 'normal'),
+        ('load_preset_button', 'normal'), ('radio_stop_below', 'normal'),
+        ('radio_stop_above', 'normal'), ('simulation_mode_check', 'normal'),
+        ('gui_theme_combobox', 'readonly'), ('plot_style_combobox', 'readonly'),
+        ('preset_listbox', 'normal'), ('start_button', 'normal'),
+        ('stop_button', 'stop'), ('scan_button', 'visa'),
+        ('resource_combobox', 'visa_readonly'), ('notes_text', 'normal'),
+        ('export_format_radios', 'normal'), ('operation_mode_radios', 'normal'),
+    )
+
     def update_ui_state(self, logging_active: Optional[bool] = None):
         """Updates UI element states based on logging status or sim mode."""
         if logging_active is not None:
             self.is_logging = logging_active
 
-        state = tk.DISABLED if self.is_logging else tk.NORMAL
-        read_only = tk.DISABLED if self.is_logging else "readonly"
-        sim_mode = self.simulation_mode_var.get()
-
-        widgets_state = [
-            (self.voltage_entry, state), (self.current_entry, state),
-            (self.threshold_entry, state), (self.save_location_entry, state),
-            (self.browse_button, state), (self.update_interval_entry, state),
-            (self.max_plot_points_entry, state), (self.preset_name_entry, state),
-            (self.save_preset_button, state), (self.delete_preset_button, state),
-            (self.load_preset_button, state), (self.radio_stop_below, state),
-            (self.radio_stop_above, state), (self.simulation_mode_check, state),
-            (self.gui_theme_combobox, read_only), (self.plot_style_combobox, read_only),
-            (self.preset_listbox, state),
-            (self.start_button, tk.DISABLED if self.is_logging else tk.NORMAL),
-            (self.stop_button, tk.NORMAL if self.is_logging else tk.DISABLED),
-            (self.scan_button, tk.DISABLED if self.is_logging or sim_mode or not pyvisa else tk.NORMAL),
-            (self.resource_combobox, tk.DISABLED if self.is_logging or sim_mode or not pyvisa else "readonly")
-        ]
-        all_radios = self.export_format_radios + self.operation_mode_radios
-        for w in all_radios: widgets_state.append((w, state))
-
-        for widget, st in widgets_state:
-            if widget and widget.winfo_exists():
-                try: widget.config(state=st)
-                except tk.TclError: pass # Ignore if widget is mid-destruction
+        logging = self.is_logging
+        no_visa = logging or self.simulation_mode_var.get() or not pyvisa
+        state_map = {
+            'normal': tk.DISABLED if logging else tk.NORMAL,
+            'readonly': tk.DISABLED if logging else "readonly",
+            'stop': tk.NORMAL if logging else tk.DISABLED,
+            'visa': tk.DISABLED if no_visa else tk.NORMAL,
+            'visa_readonly': tk.DISABLED if no_visa else "readonly",
+        }
 
-        if self.notes_text:
-            try: self.notes_text.config(state=tk.DISABLED if self.is_logging else tk.NORMAL)
-            except tk.TclError: pass
+        # Only kinds whose target state changed are touched; most calls (e.g. after a scan) flip none or two
+        changed = {k: st for k, st in state_map.items() if self._applied_states.get(k) != st}
+        if not changed: return
+        self._applied_states.update(changed)
+        if self._state_widget_paths is None: self._state_widget_paths = self._collect_state_widget_paths()
+        call = self.root.tk.call # Raw configure skips the Tkinter option-parsing wrapper
+        for path, kind in self._state_widget_paths:
+            if kind not in changed: continue
+            try: call(path, 'configure', '-state', changed[kind])
+            except tk.TclError: pass # Ignore if widget is mid-destruction
+
+    def _set_widget_state_outside_cache(self, widget, kind: str, state: str):
+        """Sets a state-bound widget's state directly, so the next update_ui_state re-applies its kind."""
+        widget.config(state=state)
+        self._applied_states.pop(kind, None)
+
+    def _collect_state_widget_paths(self) -> List[Tuple[str, str]]:
+        """Resolves _STATE_BOUND_WIDGETS to (Tk path, state kind) pairs once the UI exists."""
+        paths = []
+        for attr, kind in self._STATE_BOUND_WIDGETS:
+            w = getattr(self, attr, None)
+            if w is None: continue
+            paths.extend((str(widget), kind) for widget in (w if isinstance(w, list) else (w,)))
+        return paths
 
     def browse_save_location(self):
         """Opens a dialog to choose the save directory."""
@@ -1306,35 +1681,50 @@ class PowerLoggerApp:
         sl = filedialog.askdirectory(title="Select Save Location", initialdir=idir)
         if sl: self.save_location_var.set(sl)
 
+    # (config key, Tk variable attribute, label, validator, extra validator args)
+    _NUMERIC_FIELDS = (
+        (CONFIG_VOLTAGE, 'voltage_var', "Voltage", validate_float_input, ()),
+        (CONFIG_CURRENT, 'current_var', "Current", validate_float_input, ()),
+        (CONFIG_THRESHOLD, 'threshold_var', "Threshold", validate_float_input, (True,)),
+        (CONFIG_UPDATE_INTERVAL, 'update_interval_var', "Update Interval", validate_int_input, (MIN_UPDATE_INTERVAL_MS,)),
+        (CONFIG_MAX_PLOT_POINTS, 'max_plot_points_var', "Max Plot Points", validate_int_input, (MIN_PLOT_POINTS,)),
+        (CONFIG_MAX_REDRAW_HZ, 'max_redraw_rate_var', "Max Plot Redraw", validate_float_input, ()),
+    )
+    # (config key, Tk variable attribute, strip whitespace) for the remaining config fields
+    _PLAIN_FIELDS = (
+        (CONFIG_RESOURCE_NAME, 'resource_var', True),
+        (CONFIG_STOP_CONDITION, 'stop_condition_var', False),
+        (CONFIG_SAVE_LOCATION, 'save_location_var', True),
+        (CONFIG_EXPORT_FORMAT, 'export_format_var', False),
+        (CONFIG_GUI_THEME, 'gui_theme_var', False),
+        (CONFIG_PLOT_STYLE, 'plot_style_var', False),
+        (CONFIG_SIMULATION_MODE, 'simulation_mode_var', False),
+        (CONFIG_OPERATION_MODE, 'operation_mode_var', False),
+        (CONFIG_ANODE, 'anode_var', True),
+        (CONFIG_CATHODE, 'cathode_var', True),
+        (CONFIG_ELECTROLYTE, 'electrolyte_var', True),
+        (CONFIG_ELECTROLYTE_MOLARITY, 'electrolyte_molarity_var', True),
+    )
+
+    def _validate_numeric_fields(self, keys: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Reads and validates the numeric inputs once. Raises ValueError on the first bad one."""
+        return {key: validator(getattr(self, attr).get(), label, *extra)
+                for key, attr, label, validator, extra in self._NUMERIC_FIELDS
+                if keys is None or key in keys}
+
     def apply_and_save_config(self) -> bool:
         """Validates inputs, applies them, and saves config."""
         try:
+            validated = self._validate_numeric_fields()
+            for key, attr, strip in self._PLAIN_FIELDS:
+                value = getattr(self, attr).get()
+                validated[key] = value.strip() if strip else value
             cfg = self.config_manager.config
-            cfg[CONFIG_VOLTAGE] = validate_float_input(self.voltage_var.get(), "Voltage")
-            cfg[CONFIG_CURRENT] = validate_float_input(self.current_var.get(), "Current")
-            cfg[CONFIG_THRESHOLD] = validate_float_input(self.threshold_var.get(), "Threshold", allow_zero=True)
-            cfg[CONFIG_UPDATE_INTERVAL] = validate_int_input(self.update_interval_var.get(), "Update Interval", MIN_UPDATE_INTERVAL_MS)
-            cfg[CONFIG_MAX_PLOT_POINTS] = validate_int_input(self.max_plot_points_var.get(), "Max Plot Points", MIN_PLOT_POINTS)
-
-            cfg[CONFIG_RESOURCE_NAME] = self.resource_var.get().strip()
-            cfg[CONFIG_STOP_CONDITION] = self.stop_condition_var.get()
-            save_location = self.save_location_var.get().strip()
-            if not save_location:
-                pass
-            cfg[CONFIG_SAVE_LOCATION] = save_location
-            cfg[CONFIG_EXPORT_FORMAT] = self.export_format_var.get()
-            cfg[CONFIG_GUI_THEME] = self.gui_theme_var.get()
-            cfg[CONFIG_PLOT_STYLE] = self.plot_style_var.get()
-            cfg[CONFIG_SIMULATION_MODE] = self.simulation_mode_var.get()
-            cfg[CONFIG_OPERATION_MODE] = self.operation_mode_var.get()
-            cfg[CONFIG_ANODE] = self.anode_var.get().strip()
-            cfg[CONFIG_CATHODE] = self.cathode_var.get().strip()
-            cfg[CONFIG_ELECTROLYTE] = self.electrolyte_var.get().strip()
-            cfg[CONFIG_ELECTROLYTE_MOLARITY] = self.electrolyte_molarity_var.get().strip()
+            cfg.update(validated)
 
             self.save_notes() # Ensure notes are in config before saving
-            self.config_manager.save_config()
-            self.data_manager = DataManager(cfg[CONFIG_MAX_PLOT_POINTS]) # Re-init if changed
+            self._schedule_config_save()
+            self.data_manager.resize(cfg[CONFIG_MAX_PLOT_POINTS]) # In place; the logger keeps its reference
             self.add_status_message("Settings applied and saved.", STATUS_SUCCESS)
             return True
         except ValueError as e:
@@ -1345,37 +1735,71 @@ class PowerLoggerApp:
             print(traceback.format_exc())
             return False
 
+    def _schedule_config_save(self):
+        """Marks the config dirty and schedules a single deferred disk write."""
+        self._config_dirty = True
+        if self._config_save_after_id: self.root.after_cancel(self._config_save_after_id)
+        self._config_save_after_id = self.root.after(CONFIG_SAVE_DEBOUNCE_MS, self._flush_config_if_dirty)
+
+    def _on_config_write_error(self, description: str, filepath: str, error: Exception):
+        """Reports a failed background config/preset write (called on the writer thread)."""
+        if self._root_alive and not self._shutdown_event.is_set():
+            self.root.after(0, messagebox.showerror, "Save Error", f"Could not save {description} to file:\n{filepath}\n\n{error}")
+
+    def _flush_config_if_dirty(self):
+        """Writes the config to disk now if it changed since the last write."""
+        if self._config_save_after_id:
+            self.root.after_cancel(self._config_save_after_id)
+            self._config_save_after_id = None
+        if self._config_dirty:
+            self._config_dirty = False
+            self.config_manager.save_config_async()
+
+    # (config key, Tk variable attribute, default) for the fields stored in presets
+    _PRESET_FIELDS = (
+        (CONFIG_RESOURCE_NAME, 'resource_var', ""),
+        (CONFIG_VOLTAGE, 'voltage_var', "4.0"),
+        (CONFIG_CURRENT, 'current_var', "0.5"),
+        (CONFIG_THRESHOLD, 'threshold_var', "0.062"),
+        (CONFIG_STOP_CONDITION, 'stop_condition_var', "below"),
+        (CONFIG_EXPORT_FORMAT, 'export_format_var', DEFAULT_EXPORT_FORMAT),
+        (CONFIG_OPERATION_MODE, 'operation_mode_var', MODE_CONSTANT_VOLTAGE),
+        (CONFIG_ANODE, 'anode_var', ""),
+        (CONFIG_CATHODE, 'cathode_var', ""),
+        (CONFIG_ELECTROLYTE, 'electrolyte_var', ""),
+        (CONFIG_ELECTROLYTE_MOLARITY, 'electrolyte_molarity_var', ""),
+    )
+
     def save_preset(self):
         """Saves current settings as a named preset."""
         name = self.preset_name_var.get().strip()
         if not name: messagebox.showwarning("Input Error", "Please enter a preset name."); return
         try:
             # First, validate current inputs before saving
-            v = validate_float_input(self.voltage_var.get(), "Voltage")
-            c = validate_float_input(self.current_var.get(), "Current")
-            t = validate_float_input(self.threshold_var.get(), "Threshold", allow_zero=True)
-            p_data = {
-                CONFIG_RESOURCE_NAME: self.resource_var.get(), CONFIG_VOLTAGE: v,
-                CONFIG_CURRENT: c, CONFIG_THRESHOLD: t,
-                CONFIG_STOP_CONDITION: self.stop_condition_var.get(),
-                CONFIG_EXPORT_FORMAT: self.export_format_var.get(),
-                CONFIG_OPERATION_MODE: self.operation_mode_var.get(),
-                CONFIG_ANODE: self.anode_var.get(), CONFIG_CATHODE: self.cathode_var.get(),
-                CONFIG_ELECTROLYTE: self.electrolyte_var.get(),
-                CONFIG_ELECTROLYTE_MOLARITY: self.electrolyte_molarity_var.get()
-            }
-            if self.config_manager.add_preset(name, p_data):
+            validated = self._validate_numeric_fields((CONFIG_VOLTAGE, CONFIG_CURRENT, CONFIG_THRESHOLD))
+            p_data = {key: getattr(self, attr).get() for key, attr, _ in self._PRESET_FIELDS}
+            p_data.update(validated)
+            idx = self.config_manager.add_preset(name, p_data)
+            if idx is not None:
                 self.load_presets_listbox()
+                self.preset_listbox.selection_clear(0, tk.END)
+                self.preset_listbox.selection_set(idx); self.preset_listbox.see(idx)
                 self.add_status_message(f"Preset '{name}' saved successfully.", STATUS_SUCCESS)
         except ValueError as e: messagebox.showerror("Input Error", f"Cannot save preset due to invalid input:\n{e}")
         except Exception as e: self.add_status_message(f"Error saving preset: {e}", STATUS_ERROR)
 
     def load_presets_listbox(self):
-        """Reloads the preset listbox from the config manager."""
+        """Syncs the preset listbox with the config manager, touching only added/removed rows."""
         if self.preset_listbox:
-            self.preset_listbox.delete(0, tk.END)
-            for name in self.config_manager.get_preset_names():
-                self.preset_listbox.insert(tk.END, name)
+            new = self.config_manager.get_preset_names()
+            if new != self._listbox_names:
+                new_set = set(new); old_set = set(self._listbox_names)
+                # Both lists are sorted: delete bottom-up so indices stay valid, then insert top-down
+                for idx in range(len(self._listbox_names) - 1, -1, -1):
+                    if self._listbox_names[idx] not in new_set: self.preset_listbox.delete(idx)
+                for idx, name in enumerate(new):
+                    if name not in old_set: self.preset_listbox.insert(idx, name)
+                self._listbox_names = list(new)
             self.update_ui_state()
 
     def load_preset(self):
@@ -1387,17 +1811,10 @@ class PowerLoggerApp:
             name = self.preset_listbox.get(sel[0])
             preset = self.config_manager.get_preset(name)
             if preset:
-                self.resource_var.set(preset.get(CONFIG_RESOURCE_NAME, ""))
-                self.voltage_var.set(str(preset.get(CONFIG_VOLTAGE, 4.0)))
-                self.current_var.set(str(preset.get(CONFIG_CURRENT, 0.5)))
-                self.threshold_var.set(str(preset.get(CONFIG_THRESHOLD, 0.062)))
-                self.stop_condition_var.set(preset.get(CONFIG_STOP_CONDITION, "below"))
-                self.export_format_var.set(preset.get(CONFIG_EXPORT_FORMAT, "csv"))
-                self.operation_mode_var.set(preset.get(CONFIG_OPERATION_MODE, MODE_CONSTANT_VOLTAGE))
-                self.anode_var.set(preset.get(CONFIG_ANODE, ""))
-                self.cathode_var.set(preset.get(CONFIG_CATHODE, ""))
-                self.electrolyte_var.set(preset.get(CONFIG_ELECTROLYTE, ""))
-                self.electrolyte_molarity_var.set(preset.get(CONFIG_ELECTROLYTE_MOLARITY, ""))
+                for key, attr, default in self._PRESET_FIELDS:
+                    value = preset.get(key)
+                    getattr(self, attr).set(default if value is None else str(value))
+                self._ensure_resource_listed(self.resource_var.get())
                 self.preset_name_var.set(name)
                 self._update_threshold_label()
                 self.add_status_message(f"Preset '{name}' loaded successfully.", STATUS_SUCCESS)
@@ -1405,6 +1822,14 @@ class PowerLoggerApp:
             self.add_status_message(f"Error loading preset: {e}", STATUS_ERROR)
             print(traceback.format_exc())
 
+    def _ensure_resource_listed(self, resource_name: str):
+        """Adds a preset's resource to the combobox values if it isn't there already."""
+        if not self.resource_combobox or not resource_name: return
+        current_set = set(self.resource_combobox['values'])
+        if resource_name in current_set: return
+        if any(marker in resource_name for marker in ('Missing', 'Error', 'None')): return
+        self.resource_combobox['values'] = sorted(current_set | {resource_name})
+
     def delete_preset(self):
         """Deletes the selected preset."""
         if not self.preset_listbox: return
@@ -1416,25 +1841,49 @@ class PowerLoggerApp:
                 self.load_presets_listbox()
                 self.add_status_message(f"Preset '{name}' deleted.", STATUS_INFO)
 
-    def add_status_message(self, message: str, level: str = STATUS_INFO):
-        """Adds a message to the status bar and the log text widget."""
-        ts = datetime.now().strftime("%H:%M:%S")
-        log_msg = f"[{ts}] {message}\n"
-
-        if self.log_text and self.log_text.winfo_exists():
+    def add_status_message(self, message: str, level: str = STATUS_INFO, *args):
+        """Queues a message for the status bar and log. Safe from any thread.
+
+        Extra `args` are %-formatted into `message` only when it is displayed."""
+        if level == STATUS_DEBUG and not DEBUG_MODE: return
+        self.status_queue.put((level, message, args) if args else (level, message))
+        # UI-thread callers get the message shown at the next idle point instead of the next poll.
+        # Worker threads must not touch Tk (stop() joins them from the UI thread), so they wait for check_queues.
+        if not self._drain_scheduled and self._root_alive and not self._shutdown_event.is_set() and threading.current_thread() is threading.main_thread():
+            self._drain_scheduled = True
+            self.root.after_idle(self._drain_status_queue)
+
+    def _do_add_status(self, message: str, level: str):
+        """Buffers a message for the log widget and notes it for the status bar (UI thread only)."""
+        now_s = int(time.time())
+        if now_s != self._ts_second: # Format the timestamp at most once per second
+            self._ts_second, self._ts_prefix = now_s, time.strftime("[%H:%M:%S] ", time.localtime(now_s))
+        self._log_buffer.append((self._ts_prefix + message + "\n", level))
+        self._last_status = (message, level)
+
+    def _flush_log_buffer(self):
+        """Writes all buffered messages to the log in one insert and shows only the latest in the status bar."""
+        if self.log_text and self._log_buffer:
+            chunks: List[str] = [] # Alternating text, tag; one text run per consecutive same-tag group
+            for level, group in groupby(self._log_buffer, key=itemgetter(1)):
+                chunks += ["".join(log_msg for log_msg, _ in group), level]
             try:
                 self.log_text.config(state=tk.NORMAL)
-                self.log_text.insert(tk.END, log_msg, level)
+                self.log_text.insert(tk.END, *chunks)
                 self.log_text.see(tk.END)
                 self.log_text.config(state=tk.DISABLED)
             except tk.TclError: pass # Ignore if widget gone
+        self._log_buffer.clear()
 
-        if self.status_indicator and self.status_indicator.winfo_exists():
+        if self.status_indicator and self._last_status:
+            message, level = self._last_status
             try:
-                self.status_var.set(message.split('\n')[0]) # Show first line
-                color = {"info":"blue", "success":"green", "warning":"dark orange", "error":"red", "debug": "gray"}.get(level, "black")
-                self.status_indicator.config(foreground=color)
+                self.status_var.set(message.partition('\n')[0]) # Show first line
+                if level != self._status_bar_level: # Color only changes with the level
+                    self.status_indicator.config(foreground=STATUS_COLORS.get(level, "black"))
+                    self._status_bar_level = level
             except tk.TclError: pass
+        self._last_status = None
 
     def clear_log(self):
         """Clears the log text widget."""
@@ -1457,6 +1906,8 @@ class PowerLoggerApp:
             return
 
         self.data_manager.clear_plot_data() # Clear plot data
+        self._clear_plot_lines()
+        self._axis_limits.clear() # Let the new run rescale from scratch
         self.logger = DataLogger(cfg, self.data_manager, self.status_queue)
         self.add_status_message("Initializing logger...", STATUS_INFO)
         self.update_ui_state(True)
@@ -1465,36 +1916,40 @@ class PowerLoggerApp:
 
     def _connect_and_start_logging_task(self):
         """Thread task to connect and start the logger."""
-        if self.logger:
+        if self.logger and not self._shutdown_event.is_set():
+            if pyvisa and not self.logger.is_simulating:
+                try: self.logger.rm = self.rm # Reuse the scan's manager (revived if its session was closed)
+                except Exception: pass # connect() creates one itself and reports the error
             if self.logger.connect():
                 if self.logger.start():
-                    self.root.after(0, self._post_logging_start_tasks)
+                    if not self._shutdown_event.is_set(): self.root.after(0, self._post_logging_start_tasks)
                     return
         # If any step fails, call the failure handler
-        self.root.after(0, self._handle_start_failure)
+        if not self._shutdown_event.is_set(): self.root.after(0, self._handle_start_failure)
 
     def _post_logging_start_tasks(self):
         """Tasks to run in GUI thread after logger starts."""
-        if self.root.winfo_exists():
+        if self._root_alive and not self._shutdown_event.is_set():
             self.start_animation() # Start plot updates
 
     def _handle_start_failure(self):
         """Handles GUI updates when logging fails to start."""
-        if self.root.winfo_exists():
+        if self._root_alive:
             self.add_status_message("Logging failed to start. Check connection and settings.", STATUS_ERROR)
             if self.logger: self.logger.stop() # Ensure cleanup
             self.logger = None
             self.update_ui_state(False)
 
+    def _stop_if_logging(self):
+        """Stops logging if it is still active (the logger thread ended on its own)."""
+        if self.is_logging: self.stop_logging()
+
     def stop_logging(self):
         """Stops the data logging process."""
         if not self.is_logging: return
         self.add_status_message("Stopping logging...", STATUS_INFO)
 
-        if self.ani and self.ani.event_source:
-            try: self.ani.event_source.stop()
-            except Exception: pass
-            self.ani = None
+        self.stop_animation()
 
         if self.logger:
             notes = self.notes_text.get("1.0", tk.END).strip() if self.notes_text else ""
@@ -1502,102 +1957,215 @@ class PowerLoggerApp:
             self.logger = None
 
         self.update_ui_state(False)
+        self._flush_config_if_dirty()
 
     def start_animation(self):
-        """Starts the Matplotlib animation for live plotting."""
+        """Starts the blitted live-plot loop, driven by root.after."""
         if not self.fig or not self.canvas: return
-        interval = self.config_manager.config.get(CONFIG_UPDATE_INTERVAL)
-        self.ani = animation.FuncAnimation(self.fig, self._update_plot,
-                                         interval=max(interval, MIN_UPDATE_INTERVAL_MS),
-                                         blit=False, cache_frame_data=False, repeat=True)
-        self.canvas.draw_idle()
-
-    def _update_plot(self, frame):
-        """Animation function to update plot data."""
+        self.stop_animation()
+        cfg = self.config_manager.config
+        interval = max(cfg.get(CONFIG_UPDATE_INTERVAL), MIN_UPDATE_INTERVAL_MS)
+        redraw_hz = cfg.get(CONFIG_MAX_REDRAW_HZ) or DEFAULT_MAX_REDRAW_HZ
+        # Frames never come faster than the redraw cap; each one folds in every sample since the last
+        self._base_frame_interval = self._frame_interval = max(interval, int(1000 / redraw_hz))
+        self._frame_load_ema = 1.0 # EMA of samples drained per frame
+        self._next_frame_adapt = time.monotonic() + ANIMATION_ADAPT_PERIOD_S
+        self._plot_running = True
+        self._set_lines_animated(True)
+        self.canvas.draw() # Fires draw_event, which caches the line-free background
+        self._plot_after_id = self.root.after(self._frame_interval, self._plot_frame)
+
+    def stop_animation(self):
+        """Stops the live-plot loop and leaves the lines drawn normally."""
+        if not self._plot_running: return
+        self._cancel_plot_loop()
+        self._set_lines_animated(False)
+        if self.canvas:
+            try: self.canvas.draw_idle()
+            except tk.TclError: pass
+
+    def _set_lines_animated(self, animated: bool):
+        """Marks the data lines as blitted (excluded from full draws) or as normal artists."""
+        for line in (self.line_v, self.line_i, self.line_p, self.line_r):
+            if line: line.set_animated(animated)
+
+    def _on_plot_draw(self, event):
+        """Re-caches the blit background after every full draw (resize, zoom, limit change)."""
+        if not self._plot_running or event.canvas is not self.canvas or not self.line_v.get_animated():
+            return # Not animating (or saving a file); the lines are part of the normal draw
+        self._plot_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_plot_lines()
+
+    def _draw_plot_lines(self):
+        """Draws only the four data lines onto the current canvas buffer."""
+        for ax, line in ((self.ax_v, self.line_v), (self.ax_i, self.line_i),
+                         (self.ax_p, self.line_p), (self.ax_r, self.line_r)):
+            ax.draw_artist(line)
+
+    def _plot_frame(self):
+        """One live-plot tick: pull new samples, then blit only the lines over the cached background."""
+        self._plot_after_id = None
+        if not self._plot_running or not self._root_alive or self._shutdown_event.is_set(): return
+        if self._update_plot() and self._plot_background is not None:
+            try:
+                self.canvas.restore_region(self._plot_background)
+                self._draw_plot_lines()
+                self.canvas.blit(self.fig.bbox)
+            except tk.TclError: return # Canvas went away mid-frame
+        self._plot_after_id = self.root.after(self._frame_interval, self._plot_frame)
+
+    def _adapt_frame_interval(self, drained: int):
+        """Slows the plot loop while frames come up empty and speeds it back up when samples pile up."""
+        self._frame_load_ema = 0.9 * self._frame_load_ema + 0.1 * drained
+        now = time.monotonic()
+        if now < self._next_frame_adapt: return
+        self._next_frame_adapt = now + ANIMATION_ADAPT_PERIOD_S
+        if self._frame_load_ema < 0.5:
+            self._frame_interval = min(int(self._frame_interval * 1.5), max(self._base_frame_interval, ANIMATION_MAX_INTERVAL_MS))
+        elif self._frame_load_ema > 5:
+            self._frame_interval = max(self._frame_interval // 2, self._base_frame_interval)
+
+    def _update_plot(self) -> bool:
+        """Moves new samples into the plot lines. Returns True if the lines changed."""
         lines = [self.line_v, self.line_i, self.line_p, self.line_r]
-        if not all(lines) or not self.is_logging or not self.data_manager:
-            return tuple(l for l in lines if l)
+        if not all(lines) or self.data_manager is None: return False
 
         try:
-            # Process one point to keep GUI responsive
-            while not self.data_manager.empty():
-                self.data_manager.append_for_plotting(*self.data_manager.get_nowait())
-                break # Only process one per frame update
-
-            if self.data_manager.time_data:
-                t, v, i, p, r = (np.array(d) for d in [
-                    self.data_manager.time_data, self.data_manager.voltage_data,
-                    self.data_manager.current_data, self.data_manager.power_data,
-                    self.data_manager.resistance_data])
-                self.line_v.set_data(t, v)
-                self.line_i.set_data(t, i)
-                self.line_p.set_data(t, p)
-                self.line_r.set_data(t, r)
-                self._update_plot_axes()
-
-        except queue.Empty:
-            pass # No new data, just return
+            # Fold everything queued since the last frame (bounded) into one update
+            drained = self.data_manager.drain_for_plotting()
+            self._adapt_frame_interval(drained)
+            if not drained or not self._plot_visible: return False # Hidden: caught up by _refresh_plot
+            self._set_line_data()
+            if not self._axes_cover_window() and self._update_plot_axes():
+                self.canvas.draw() # New ticks/labels; draw_event re-caches the background
+            return True
         except Exception as e:
             print(f"Debug: Plot Update Error: {e}")
-            # print(traceback.format_exc()) # Uncomment for detailed debug
+            if DEBUG_MODE: print(traceback.format_exc()) # Per-frame path; full trace only with RIGOL_DEBUG=1
+            return False
 
-        return tuple(l for l in lines if l)
+    def _set_line_data(self):
+        """Points the four lines at the current plot window."""
+        t, v, i, p, r = self.data_manager.view() # Row views, no copies
+        self.line_v.set_data(t, v)
+        self.line_i.set_data(t, i)
+        self.line_p.set_data(t, p)
+        self.line_r.set_data(t, r)
+
+    def _refresh_plot(self):
+        """Brings the lines and axes up to date after the plot tab was hidden, with one full draw."""
+        if not self.line_v or self.data_manager is None or not self.canvas: return
+        try:
+            self._set_line_data()
+            self._update_plot_axes()
+            self.canvas.draw_idle() # draw_event re-caches the blit background while animating
+        except Exception as e:
+            print(f"Debug: Plot Refresh Error: {e}")
+            if DEBUG_MODE: print(traceback.format_exc())
 
-    def _update_plot_axes(self):
-        """Updates the plot axes limits."""
+    def _update_plot_axes(self) -> bool:
+        """Updates the plot axes limits. Returns True if any limit changed."""
         dm = self.data_manager
         axes = [self.ax_v, self.ax_i, self.ax_p, self.ax_r]
-        datas = [dm.voltage_data, dm.current_data, dm.power_data, dm.resistance_data]
         t_min = 0.0
-        t_max = dm.time_data[-1] if dm.time_data else 1.0 # Default to 1.0 if no data
+        t_max = dm.time_data[-1] if len(dm) else 1.0 # Default to 1.0 if no data
 
         # Ensure t_max is always > t_min
         t_upper = max(t_max * 1.1, t_min + 1.0)
-        self.ax_r.set_xlim(t_min, t_upper)
+        changed = self._set_limits_if_changed(self.ax_r, 'x', t_min, t_upper)
 
-        for ax, data in zip(axes, datas):
-            if not data: ax.set_ylim(0, 1); continue
-            d_finite = [x for x in data if np.isfinite(x)]
-            if not d_finite: y_min, y_max = 0.0, 1.0
-            else: y_min, y_max = min(d_finite), max(d_finite)
-            y_range = y_max - y_min
-            pad = 0.1 if abs(y_range) < 1e-6 else 0.05 * y_range
-            ax.set_ylim(y_min - pad, y_max + pad)
+        for channel, ax in enumerate(axes):
+            changed |= self._set_limits_if_changed(ax, 'y', *self._y_target_limits(channel))
+        return changed
+
+    def _y_target_limits(self, channel: int) -> Tuple[float, float]:
+        """Padded y-limits that fit the plot window's data for channel 0-3 (V, I, P, R)."""
+        dm = self.data_manager
+        if not len(dm): return 0.0, 1.0
+        y_min, y_max = dm.channel_limits(channel) or (0.0, 1.0) # Cached; rescans only after an extreme is evicted
+        y_range = y_max - y_min
+        pad = 0.1 if abs(y_range) < 1e-6 else 0.05 * y_range
+        return y_min - pad, y_max + pad
+
+    def _axes_cover_window(self) -> bool:
+        """True if the axis limits contain all window data and aren't more than AXIS_LIMIT_RTOL too wide."""
+        dm = self.data_manager
+        x_lim = self._axis_limits.get((id(self.ax_r), 'x'))
+        if x_lim is None or dm.time_data[-1] > x_lim[1]: return False
+        for channel, ax in enumerate((self.ax_v, self.ax_i, self.ax_p, self.ax_r)):
+            y_lim = self._axis_limits.get((id(ax), 'y'))
+            if y_lim is None: return False
+            lo, hi = self._y_target_limits(channel)
+            if lo < y_lim[0] or hi > y_lim[1]: return False # Data outside the view
+            # Extremes that left the sliding window: shrink back once the view is noticeably too wide
+            tol = AXIS_LIMIT_RTOL * max(y_lim[1] - y_lim[0], 1e-12)
+            if lo > y_lim[0] + tol or hi < y_lim[1] - tol: return False
+        return True
+
+    def _set_limits_if_changed(self, ax, which: str, lo: float, hi: float):
+        """Sets axis limits unless they only shrink by less than AXIS_LIMIT_RTOL of the span. Returns True if set."""
+        key = (id(ax), which)
+        prev = self._axis_limits.get(key)
+        if prev is not None:
+            tol = AXIS_LIMIT_RTOL * max(prev[1] - prev[0], 1e-12)
+            # Only small inward moves are skipped; growing the view is always applied so no data is hidden
+            if prev[0] <= lo <= prev[0] + tol and prev[1] - tol <= hi <= prev[1]: return False
+        (ax.set_xlim if which == 'x' else ax.set_ylim)(lo, hi)
+        self._axis_limits[key] = (lo, hi)
+        return True
 
-        # No need to call draw_idle here, FuncAnimation handles it.
 
     def check_queues(self):
-        """Periodically checks status/error queues."""
+        """Periodically checks status/error queues, polling faster while messages arrive."""
+        if self._shutdown_event.is_set(): return
+        if self._drain_status_queue():
+            self._poll_interval_ms = QUEUE_POLL_MIN_MS
+        else: # Idle: back off gradually so a quiet app wakes up only a couple of times a second
+            self._poll_interval_ms = min(self._poll_interval_ms * 3 // 2, QUEUE_POLL_MAX_MS)
+        self._after_check_queues_id = self.root.after(self._poll_interval_ms, self.check_queues)
+
+    def _drain_status_queue(self) -> int:
+        """Shows all queued status messages and handles logger signals. Returns how many were queued."""
+        self._drain_scheduled = False
+        pending = self.status_queue.qsize()
         try:
-            while not self.status_queue.empty():
-                level, message = self.status_queue.get_nowait()
-                self.add_status_message(message, level)
-                # Check for special signals
-                if level == "STOP_SIGNAL": self.stop_logging()
-                if level == "LOGGER_FINISHED" and self.is_logging: self.stop_logging()
+            for _ in range(pending): # Bounded; later arrivals wait for the next drain
+                level, message, *args = self.status_queue.get_nowait()
+                self._do_add_status(message % args[0] if args else message, level)
+                handler = self._signal_handlers.get(level) # Special signals
+                if handler: handler()
 
         except queue.Empty:
             pass
         except Exception as e:
             print(f"Error checking queues: {e}")
-
-        self._after_check_queues_id = self.root.after(150, self.check_queues) # Poll ~6-7 times/sec
+            if DEBUG_MODE: print(traceback.format_exc())
+        if self._log_buffer or self._last_status: self._flush_log_buffer() # One widget update per drain
+        return pending
 
     def on_closing(self):
         """Handles window closing event."""
-        if self._after_check_queues_id:
-            try: self.root.after_cancel(self._after_check_queues_id)
-            except Exception: pass
-
         if self.is_logging:
             if not messagebox.askyesno("Confirm Exit", "Logging is active. Are you sure you want to stop and exit?"):
                 return
 
+        self._shutdown_event.set() # From here on the poll/plot loops and worker callbacks stand down
+        for after_id in (self._after_check_queues_id, self._plot_after_id, self._theme_apply_after_id, self._style_apply_after_id):
+            if after_id:
+                try: self.root.after_cancel(after_id)
+                except Exception: pass
+
         self.add_status_message("Exiting application...", STATUS_INFO)
         self.stop_logging() # Ensure logging is stopped & data saved
         self.apply_and_save_config() # Save final settings
-        plt.close('all') # Close plot windows
-        self.executor.shutdown(wait=False, cancel_futures=True) # Don't wait for threads
+        self._flush_config_if_dirty() # Write now; pending timers die with the window
+        self.config_manager.close() # Wait for the background config write to land
+        if getattr(self, 'canvas', None): # Release the Tk photo image chain before the root goes
+            try: self.canvas.get_tk_widget().destroy()
+            except tk.TclError: pass
+        # Cancel queued tasks and let running ones finish on a side thread, so a stuck VISA call can't freeze the close
+        threading.Thread(target=self.executor.shutdown, kwargs={'wait': True, 'cancel_futures': True},
+                         name="ExecutorShutdown", daemon=True).start()
         self.root.destroy()
 
 # =============================================================================